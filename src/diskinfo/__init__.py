@@ -3,11 +3,13 @@
 #    Peter Sulyok (C) 2022-2024.
 #
 from diskinfo.disktype import DiskType
-from diskinfo.utils import _read_file, _read_udev_property, _read_udev_path, size_in_hrf, time_in_hrf
+from diskinfo.utils import _read_file, _read_udev_property, _read_udev_path, _parse_udev, _load_udev, \
+    size_in_hrf, time_in_hrf
 from diskinfo.partition import Partition
 from diskinfo.disksmart import DiskSmartData, SmartAttribute, NvmeAttributes
 from diskinfo.disk import Disk
 from diskinfo.diskinfo import DiskInfo
 
 __all__ = ["DiskType", "Partition", "DiskSmartData", "SmartAttribute", "NvmeAttributes", "Disk", "DiskInfo",
-           "_read_file", "_read_udev_property", "_read_udev_path", "size_in_hrf", "time_in_hrf"]
+           "_read_file", "_read_udev_property", "_read_udev_path", "_parse_udev", "_load_udev",
+           "size_in_hrf", "time_in_hrf"]
@@ -2,13 +2,116 @@
 #    Module `demo`: implements demos for `diskinfo` package.
 #    Peter Sulyok (C) 2022-2024.
 #
+# The `rich` package is imported only by the demo functions which use it (e.g. not for the usage help).
+# pylint: disable=import-outside-toplevel
 import sys
-from rich import print as rprint
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
-from rich.console import Group
-from diskinfo import DiskType, Disk, DiskInfo, size_in_hrf, time_in_hrf
+from collections import Counter
+from functools import lru_cache
+from operator import methodcaller
+from typing import Tuple
+from diskinfo import DiskType, Disk, DiskInfo, Partition, size_in_hrf, time_in_hrf
+
+
+# Rows (label, value template, value getter) of disk_demo() table.
+_DISK_ATTR_ROWS = (
+    ("name", "[bold royal_blue1]{}[/]", methodcaller("get_name")),
+    ("path", "[bold chartreuse4]{}[/]", methodcaller("get_path")),
+    ("by-id path", "[gray54]{}[/]", methodcaller("get_byid_path")),
+    ("by-path path", "[gray54]{}[/]", methodcaller("get_bypath_path")),
+    ("model", "[bold orange3]{}[/]", methodcaller("get_model")),
+    ("size", "[bold slate_blue1]{:.1f} {}[/]", methodcaller("get_size_in_hrf", units=0)),
+    ("serial", "[bold light_salmon1]{}[/]", methodcaller("get_serial_number")),
+    ("firmware", "[bold light_coral]{}[/]", methodcaller("get_firmware")),
+    ("wwn id", "[bold sky_blue3]{}[/]", methodcaller("get_wwn")),
+    ("disk type", "[bold sea_green2]{}[/]", methodcaller("get_type_str")),
+    ("device id", "[bold blue1]{}[/]", methodcaller("get_device_id")),
+    # A missing or zero temperature is displayed as "-".
+    ("temperature", "[bold bright_magenta]{} C[/]", lambda d: d.get_temperature(sudo=True) or None),
+    ("physical block size", "[bold wheat4]{} bytes[/]", methodcaller("get_physical_block_size")),
+    ("logical block size", "[bold wheat4]{} bytes[/]", methodcaller("get_logical_block_size")),
+    ("partition table type", "[bold gray62]{}[/]", methodcaller("get_partition_table_type")),
+    ("partition table uuid", "[bold green3]{}[/]", methodcaller("get_partition_table_uuid")),
+)
+_NO_VALUE: str = "[bold bright_magenta]-[/]"
+
+# Column templates (name, justify, style) of the demo tables.
+_DISK_LIST_COLUMNS = (
+    ("Name", "left", "bold orange1"),
+    ("Type", "left", "bold orchid"),
+    ("Model", "left", "bold gray54"),
+    ("Path", "left", "bold green"),
+    ("Temp", "right", "bold orchid1"),
+    ("Serial", "left", "bold purple3"),
+    ("Firmware", "left", "bold slate_blue1"),
+    ("Size", "right", "bold blue"),
+)
+_DISK_ATTR_COLUMNS = (
+    ("Attribute", "left", "steel_blue1"),
+    ("Value", "left", "orchid"),
+)
+_SMART_ATTR_COLUMNS = (
+    ("Attribute", "left", "steel_blue1"),
+    ("Value", "left", "bold orchid"),
+)
+_PARTITION_COLUMNS = (
+    ("Name", "left", "bold orange1"),
+    ("Type", "left", "bold orchid"),
+    ("Start", "right", "bold gray54"),
+    ("Size", "right", "bold gray54"),
+    ("Label", "left", "bold purple3"),
+    ("Mounting point", "left", "bold green"),
+    ("Free", "right", "bold blue"),
+)
+
+
+def _disk_row(d: Disk) -> Tuple[str, ...]:
+    """Collects the formatted column values of a disk for the disk list."""
+    s, u = d.get_size_in_hrf()
+    temp = d.get_temperature(sudo=True)
+    return (d.get_name(), d.get_type_str(), d.get_model(), d.get_path(), f"{temp:.1f} C" if temp else "",
+            d.get_serial_number(), d.get_firmware(), f"{s:.1f} {u}")
+
+
+def _partition_row(p: Partition) -> Tuple[str, ...]:
+    """Collects the formatted column values of a partition for the partition list."""
+    # Free space in percent, rounded with integer arithmetic (exact for any size).
+    size = p.get_part_size()
+    free = (p.get_fs_free_size() * 100 + size // 2) // size if size else 0
+    return (p.get_name(), p.get_fs_type(), str(p.get_part_offset()), str(size), p.get_fs_label(),
+            p.get_fs_mounting_point(), f"{free:>3d} %")
+
+
+def _header(text: str):
+    """Creates the header panel of a demo."""
+    from rich.panel import Panel
+    from rich import box
+    return Panel(text, box=box.MINIMAL, expand=False)
+
+
+def _table(columns: Tuple[Tuple[str, str, str], ...]):
+    """Creates an empty demo table with the specified column templates."""
+    from rich.table import Table
+    from rich import box
+    table = Table(border_style="gray30", box=box.MINIMAL)
+    for name, justify, style in columns:
+        table.add_column(name, justify=justify, style=style)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _console():
+    """Returns the shared console of the demos. All values are styled with explicit markup, so the automatic
+    highlighter is disabled."""
+    from rich.console import Console
+    return Console(highlight=False)
+
+
+def _render(title: str, *renderables) -> None:
+    """Prints the header and the table of a demo in a titled frame panel."""
+    from rich.panel import Panel
+    from rich.console import Group
+    _console().print(Panel(Group(*renderables), title=title, title_align="left", border_style="gray30",
+                           expand=False))
 
 
 def disklist_demo():
@@ -17,81 +120,47 @@ def disklist_demo():
     # Explore disks in the system.
     di = DiskInfo()
 
-    # Count number of the different disk types.
-    disk_num = di.get_disk_number()
-    hdd_num = di.get_disk_number(included={DiskType.HDD}, excluded={DiskType.NVME, DiskType.SSD})
-    ssd_num = di.get_disk_number(included={DiskType.SSD}, excluded={DiskType.NVME, DiskType.HDD})
-    nvme_num = di.get_disk_number(included={DiskType.NVME}, excluded={DiskType.HDD})
+    # Count number of the different disk types in a single pass.
+    disks = di.get_disk_list(sorting=True)
+    type_counter = Counter(d.get_type() for d in disks)
+    disk_num = len(disks)
+    hdd_num = type_counter[DiskType.HDD]
+    ssd_num = type_counter[DiskType.SSD]
+    nvme_num = type_counter[DiskType.NVME]
     verb = "are"
     plural = "s"
     if disk_num <= 1:
         verb = "is"
         plural = ""
 
-    panel = Panel(f"[markdown.strong]There {verb} [bold sky_blue2]{disk_num}[/] disk{plural} installed in this"
-                  f" system :point_right: [bold sky_blue2]{hdd_num}[/] HDD(s), [bold sky_blue2]{ssd_num}[/]"
-                  f" SSD(s), [bold sky_blue2]{nvme_num}[/] NVME(s)[/]", box=box.MINIMAL, expand=False)
-    table = Table(border_style="gray30", box=box.MINIMAL)
-    table.add_column("Name", justify="left", style="bold orange1")
-    table.add_column("Type", justify="left", style="bold orchid")
-    table.add_column("Model", justify="left", style="bold gray54")
-    table.add_column("Path", justify="left", style="bold green")
-    table.add_column("Temp", justify="right", style="bold orchid1")
-    table.add_column("Serial", justify="left", style="bold purple3")
-    table.add_column("Firmware", justify="left", style="bold slate_blue1")
-    table.add_column("Size", justify="right", style="bold blue")
-    disks = di.get_disk_list(sorting=True)
-    for d in disks:
-        s, u = d.get_size_in_hrf()
-        temp = d.get_temperature(sudo=True)
-        if temp:
-            temp_str = f"{temp:.1f} C"
-        else:
-            temp_str = ""
-        table.add_row(d.get_name(), d.get_type_str(), d.get_model(), d.get_path(),
-                      temp_str, d.get_serial_number(), d.get_firmware(),
-                      f"{s:.1f} {u}")
-    group = Group(panel, table)
-    rprint(Panel(group, title="diskinfo demo: disks", title_align="left", border_style="gray30", expand=False))
+    panel = _header(f"[markdown.strong]There {verb} [bold sky_blue2]{disk_num}[/] disk{plural} installed in this"
+                    f" system :point_right: [bold sky_blue2]{hdd_num}[/] HDD(s), [bold sky_blue2]{ssd_num}[/]"
+                    f" SSD(s), [bold sky_blue2]{nvme_num}[/] NVME(s)[/]")
+    table = _table(_DISK_LIST_COLUMNS)
+    # Collect all rows first, then fill the table.
+    rows = [_disk_row(d) for d in disks]
+    for row in rows:
+        table.add_row(*row)
+    _render("diskinfo demo: disks", panel, table)
 
 
 def disk_demo(name: str):
     """Disk attributes demo."""
 
     d = Disk(name)
-    panel = Panel(f"[markdown.strong]Standard disk attributes of:[/] [bold green]{name}[/]",
-                  box=box.MINIMAL, expand=False)
-    table = Table(border_style="gray30", box=box.MINIMAL)
-    table.add_column("Attribute", justify="left", style="steel_blue1")
-    table.add_column("Value", justify="left", style="orchid")
-
-    table.add_row("name", f"[bold royal_blue1]{d.get_name()}[/]")
-    table.add_row("path", f"[bold chartreuse4]{d.get_path()}[/]")
-    table.add_row("by-id path", f"[gray54]{str(d.get_byid_path())}[/]")
-    table.add_row("by-path path", f"[gray54]{str(d.get_bypath_path())}[/]")
-    table.add_row("model", f"[bold orange3]{str(d.get_model())}[/]")
-    s, u = d.get_size_in_hrf(units=0)
-    size_str = f"[bold slate_blue1]{s:.1f} {u}[/]"
-    table.add_row("size", size_str)
-    table.add_row("serial", f"[bold light_salmon1]{d.get_serial_number()}[/]")
-    table.add_row("firmware", f"[bold light_coral]{d.get_firmware()}[/]")
-    table.add_row("wwn id", f"[bold sky_blue3]{d.get_wwn()}[/]")
-    table.add_row("disk type", f"[bold sea_green2]{d.get_type_str()}[/]")
-    table.add_row("device id", f"[bold blue1]{d.get_device_id()}[/]")
-    temp = d.get_temperature(sudo=True)
-    if temp:
-        temp_str = f"[bold bright_magenta]{d.get_temperature(sudo=True)} C[/]"
-    else:
-        temp_str = "[bold bright_magenta]-[/]"
-    table.add_row("temperature", temp_str)
-    table.add_row("physical block size", f"[bold wheat4]{str(d.get_physical_block_size())} bytes [/]")
-    table.add_row("logical block size", f"[bold wheat4]{str(d.get_logical_block_size())} bytes[/]")
-    table.add_row("partition table type", f"[bold gray62]{d.get_partition_table_type()}[/]")
-    table.add_row("partition table uuid", f"[bold green3]{d.get_partition_table_uuid()}[/]")
+    panel = _header(f"[markdown.strong]Standard disk attributes of:[/] [bold green]{name}[/]")
+    table = _table(_DISK_ATTR_COLUMNS)
 
-    group = Group(panel, table)
-    rprint(Panel(group, title="diskinfo demo: disk attributes", title_align="left", border_style="gray30",
-                 expand=False))
+    for label, template, getter in _DISK_ATTR_ROWS:
+        value = getter(d)
+        if value is None:
+            table.add_row(label, _NO_VALUE)
+        elif isinstance(value, tuple):
+            table.add_row(label, template.format(*value))
+        else:
+            table.add_row(label, template.format(value))
+
+    _render("diskinfo demo: disk attributes", panel, table)
 
 
 def smart_demo(name: str):
@@ -100,99 +169,92 @@ def smart_demo(name: str):
     d = Disk(name)
     sd = d.get_smart_data(sudo=True)
     if not sd:
-        panel = Panel(f"[markdown.strong]SMART attributes of:[/] [bold green]{name}[/]\n"
-                      "\n"
-                      "[bold red]Device is not identified/supported[/]\n"
-                      "[bold red]or 'smartctl' command cannot be executed![/]",
-                      box=box.MINIMAL, expand=False)
-        group = Group(panel)
+        panel = _header(f"[markdown.strong]SMART attributes of:[/] [bold green]{name}[/]\n"
+                        "\n"
+                        "[bold red]Device is not identified/supported[/]\n"
+                        "[bold red]or 'smartctl' command cannot be executed![/]")
+        _render("diskinfo demo: SMART attributes", panel)
+        return
+
+    panel = _header(f"[markdown.strong]SMART attributes of:[/] [bold green]{name}[/]")
+    table = _table(_SMART_ATTR_COLUMNS)
+    table.add_row("SMART enabled", "[bold green]yes[/]" if sd.smart_enabled else "[bold red]no[/]")
+    table.add_row("SMART capable", "[bold green]yes[/]" if sd.smart_capable else "[bold red]no[/]")
+    table.add_row("health assessment", "[bold green]PASS[/]" if sd.healthy else "[bold red]FAIL[/]")
+    if d.is_nvme():
+        if hasattr(sd.nvme_attributes, "critical_warning"):
+            table.add_row("critical warning",
+                          f"[bold green]{sd.nvme_attributes.critical_warning}[/]"
+                          if sd.nvme_attributes.critical_warning == 0 else
+                          f"[bold red]{sd.nvme_attributes.critical_warning}[/]")
+        if hasattr(sd.nvme_attributes, "temperature"):
+            table.add_row("temperature", f"[bold blue]{sd.nvme_attributes.temperature} C[/]")
+        if hasattr(sd.nvme_attributes, "percentage_used"):
+            table.add_row("percentage used", f"[bold orange3]{sd.nvme_attributes.percentage_used}%[/]")
+        if hasattr(sd.nvme_attributes, "data_units_read"):
+            s, u = size_in_hrf(sd.nvme_attributes.data_units_read * 1000 * 512)
+            size_str = f"[bold wheat4]{s:.1f} {u}[/]"
+            table.add_row("data units read", size_str)
+        if hasattr(sd.nvme_attributes, "data_units_written"):
+            s, u = size_in_hrf(sd.nvme_attributes.data_units_written * 1000 * 512)
+            size_str = f"[bold wheat4]{s:.1f} {u}[/]"
+            table.add_row("data units written", size_str)
+        if hasattr(sd.nvme_attributes, "power_on_hours"):
+            t, u = time_in_hrf(sd.nvme_attributes.power_on_hours, 2)
+            poh = f"[bold medium_purple3]{t:.1f} {u}[/]"
+            table.add_row("power on time", poh)
+        if hasattr(sd.nvme_attributes, "power_cycles"):
+            table.add_row("power cycles", f"[bold orange4]{sd.nvme_attributes.power_cycles}[/]")
+        if hasattr(sd.nvme_attributes, "unsafe_shutdowns"):
+            table.add_row("unsafe shutdowns",
+                          f"[bold indian_red1]{sd.nvme_attributes.unsafe_shutdowns}[/]")
+        if hasattr(sd.nvme_attributes, "error_information_log_entries"):
+            table.add_row("error information log entries",
+                          f"[bold wheat4]{sd.nvme_attributes.error_information_log_entries}[/]")
+        if hasattr(sd.nvme_attributes, "media_and_data_integrity_errors"):
+            table.add_row("media and data integrity errors",
+                          f"[bold wheat4]{sd.nvme_attributes.media_and_data_integrity_errors}[/]")
 
     else:
-        panel = Panel(f"[markdown.strong]SMART attributes of:[/] [bold green]{name}[/]",
-                      box=box.MINIMAL, expand=False)
-        table = Table(border_style="gray30", box=box.MINIMAL)
-        table.add_column("Attribute", justify="left", style="steel_blue1")
-        table.add_column("Value", justify="left", style="bold orchid")
-        table.add_row("SMART enabled", "[bold green]yes[/]" if sd.smart_enabled else "[bold red]no[/]")
-        table.add_row("SMART capable", "[bold green]yes[/]" if sd.smart_capable else "[bold red]no[/]")
-        table.add_row("health assessment", "[bold green]PASS[/]" if sd.healthy else "[bold red]FAIL[/]")
-        if d.is_nvme():
-            if hasattr(sd.nvme_attributes, "critical_warning"):
-                table.add_row("critical warning",
-                              f"[bold green]{str(sd.nvme_attributes.critical_warning)}[/]"
-                              if sd.nvme_attributes.critical_warning == 0 else
-                              f"[bold red]{str(sd.nvme_attributes.critical_warning)}[/]")
-            if hasattr(sd.nvme_attributes, "temperature"):
-                table.add_row("temperature", f"[bold blue]{sd.nvme_attributes.temperature} C[/]")
-            if hasattr(sd.nvme_attributes, "percentage_used"):
-                table.add_row("percentage used", f"[bold orange3]{sd.nvme_attributes.percentage_used}%[/]")
-            if hasattr(sd.nvme_attributes, "data_units_read"):
-                s, u = size_in_hrf(sd.nvme_attributes.data_units_read * 1000 * 512)
-                size_str = f"[bold wheat4]{s:.1f} {u}[/]"
-                table.add_row("data units read", size_str)
-            if hasattr(sd.nvme_attributes, "data_units_written"):
-                s, u = size_in_hrf(sd.nvme_attributes.data_units_written * 1000 * 512)
-                size_str = f"[bold wheat4]{s:.1f} {u}[/]"
-                table.add_row("data units written", size_str)
-            if hasattr(sd.nvme_attributes, "power_on_hours"):
-                t, u = time_in_hrf(sd.nvme_attributes.power_on_hours, 2)
+        if hasattr(sd, "smart_attributes"):
+            index = sd.find_smart_attribute_by_name("Reallocated_Sector_Ct")
+            if index != -1:
+                c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
+                table.add_row("reallocated sector count", c)
+            index = sd.find_smart_attribute_by_name("Airflow_Temperature")
+            if index != -1:
+                temp = sd.smart_attributes[index].raw_value
+                temp_str = f"[bold medium_purple3]{temp} C[/]"
+                table.add_row("airflow temperature", temp_str)
+            index = sd.find_smart_attribute_by_name("Power_On_Hours")
+            if index != -1:
+                t, u = time_in_hrf(sd.smart_attributes[index].raw_value, 2)
                 poh = f"[bold medium_purple3]{t:.1f} {u}[/]"
                 table.add_row("power on time", poh)
-            if hasattr(sd.nvme_attributes, "power_cycles"):
-                table.add_row("power cycles", f"[bold orange4]{str(sd.nvme_attributes.power_cycles)}[/]")
-            if hasattr(sd.nvme_attributes, "unsafe_shutdowns"):
-                table.add_row("unsafe shutdowns",
-                              f"[bold indian_red1]{str(sd.nvme_attributes.unsafe_shutdowns)}[/]")
-            if hasattr(sd.nvme_attributes, "error_information_log_entries"):
-                table.add_row("error information log entries",
-                              f"[bold wheat4]{str(sd.nvme_attributes.error_information_log_entries)}[/]")
-            if hasattr(sd.nvme_attributes, "media_and_data_integrity_errors"):
-                table.add_row("media and data integrity errors",
-                              f"[bold wheat4]{str(sd.nvme_attributes.media_and_data_integrity_errors)}[/]")
+            index = sd.find_smart_attribute_by_name("Power_Cycle_Count")
+            if index != -1:
+                pcc = sd.smart_attributes[index].raw_value
+                table.add_row("power cycles", f"[bold orange4]{pcc}[/]")
+            index = sd.find_smart_attribute_by_name("Wear_Leveling_Count")
+            if index != -1:
+                c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
+                table.add_row("wear leveling count", c)
+            index = sd.find_smart_attribute_by_name("Uncorrectable_Error_Cnt")
+            if index != -1:
+                c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
+                table.add_row("uncorrectable error count", c)
+            index = sd.find_smart_attribute_by_name("CRC_Error_Count")
+            if index != -1:
+                c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
+                table.add_row("CRC error count", c)
+            index = sd.find_smart_attribute_by_name("LBAs_Written")
+            if index != -1:
+                lbaw = sd.smart_attributes[index].raw_value
+                s, u = size_in_hrf(lbaw * 512)
+                size_str = f"[bold medium_violet_red]{s:.1f} {u}[/]"
+                table.add_row("total LBAs written", size_str)
 
-        else:
-            if hasattr(sd, "smart_attributes"):
-                index = sd.find_smart_attribute_by_name("Reallocated_Sector_Ct")
-                if index != -1:
-                    c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
-                    table.add_row("reallocated sector count", c)
-                index = sd.find_smart_attribute_by_name("Airflow_Temperature")
-                if index != -1:
-                    temp = sd.smart_attributes[index].raw_value
-                    temp_str = f"[bold medium_purple3]{temp} C[/]"
-                    table.add_row("airflow temperature", temp_str)
-                index = sd.find_smart_attribute_by_name("Power_On_Hours")
-                if index != -1:
-                    t, u = time_in_hrf(sd.smart_attributes[index].raw_value, 2)
-                    poh = f"[bold medium_purple3]{t:.1f} {u}[/]"
-                    table.add_row("power on time", poh)
-                index = sd.find_smart_attribute_by_name("Power_Cycle_Count")
-                if index != -1:
-                    pcc = str(sd.smart_attributes[index].raw_value)
-                    table.add_row("power cycles", f"[bold orange4]{pcc}[/]")
-                index = sd.find_smart_attribute_by_name("Wear_Leveling_Count")
-                if index != -1:
-                    c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
-                    table.add_row("wear leveling count", c)
-                index = sd.find_smart_attribute_by_name("Uncorrectable_Error_Cnt")
-                if index != -1:
-                    c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
-                    table.add_row("uncorrectable error count", c)
-                index = sd.find_smart_attribute_by_name("CRC_Error_Count")
-                if index != -1:
-                    c = f"[gray54]{sd.smart_attributes[index].raw_value}[/]"
-                    table.add_row("CRC error count", c)
-                index = sd.find_smart_attribute_by_name("LBAs_Written")
-                if index != -1:
-                    lbaw = sd.smart_attributes[index].raw_value
-                    s, u = size_in_hrf(lbaw * 512)
-                    size_str = f"[bold medium_violet_red]{s:.1f} {u}[/]"
-                    table.add_row("total LBAs written", size_str)
-
-        group = Group(panel, table)
-
-    rprint(Panel(group, title="diskinfo demo: SMART attributes", title_align="left", border_style="gray30",
-                 expand=False))
+    _render("diskinfo demo: SMART attributes", panel, table)
 
 
 def partition_demo(name: str):
@@ -200,25 +262,17 @@ def partition_demo(name: str):
 
     d = Disk(name)
     plist = d.get_partition_list()
+    if not plist:
+        _render("[markdown.strong]diskinfo demo: partitions[/]",
+                _header(f"[markdown.strong]There are no partitions on disk[/] [bold green]{name}[/]"))
+        return
 
-    panel = Panel(f"[markdown.strong]There are {len(plist)} partitions on disk[/] [bold green]{name}[/]\n"
-                  f"[markdown.strong]Partition table type is[/] [bold green]{d.get_partition_table_type()}[/]",
-                  box=box.MINIMAL, expand=False)
-    table = Table(border_style="gray30", box=box.MINIMAL)
-    table.add_column("Name", justify="left", style="bold orange1")
-    table.add_column("Type", justify="left", style="bold orchid")
-    table.add_column("Start", justify="right", style="bold gray54")
-    table.add_column("Size", justify="right", style="bold gray54")
-    table.add_column("Label", justify="left", style="bold purple3")
-    table.add_column("Mounting point", justify="left", style="bold green")
-    table.add_column("Free", justify="right", style="bold blue")
-    for p in plist:
-        free_size_str = f"{round(float(p.get_fs_free_size() / p.get_part_size() * 100)):>3d} %"
-        table.add_row(p.get_name(), p.get_fs_type(), str(p.get_part_offset()), str(p.get_part_size()),
-                      p.get_fs_label(), p.get_fs_mounting_point(), free_size_str)
-    group = Group(panel, table)
-    rprint(Panel(group, title="[markdown.strong]diskinfo demo: partitions[/]", title_align="left",
-                 border_style="gray30", expand=False))
+    panel = _header(f"[markdown.strong]There are {len(plist)} partitions on disk[/] [bold green]{name}[/]\n"
+                    f"[markdown.strong]Partition table type is[/] [bold green]{d.get_partition_table_type()}[/]")
+    table = _table(_PARTITION_COLUMNS)
+    for row in map(_partition_row, plist):
+        table.add_row(*row)
+    _render("[markdown.strong]diskinfo demo: partitions[/]", panel, table)
 
 
 def usage():
@@ -231,19 +285,25 @@ def usage():
           "\tpython -m diskinfo.demo sda -p     - displays sda partitions\n")
 
 
+# Demo functions of the command line options (following the device name).
+_OPTIONS = {
+    "-p": partition_demo,
+    "-s": smart_demo,
+}
+
+
 def main():
     """Demo application for package `diskinfo`."""
 
-    if len(sys.argv) == 1:
+    args = sys.argv[1:]
+    if not args:
         disklist_demo()
-    elif len(sys.argv) == 2 and (sys.argv[1] == "-h" or sys.argv[1] == "--help"):
+    elif args[0] in ("-h", "--help") or len(args) > 2:
         usage()
-    elif len(sys.argv) == 2:
-        disk_demo(sys.argv[1])
-    elif len(sys.argv) == 3 and sys.argv[2] == "-p":
-        partition_demo(sys.argv[1])
-    elif len(sys.argv) == 3 and sys.argv[2] == "-s":
-        smart_demo(sys.argv[1])
+    elif len(args) == 1:
+        disk_demo(args[0])
+    elif args[1] in _OPTIONS:
+        _OPTIONS[args[1]](args[0])
     else:
         usage()
 
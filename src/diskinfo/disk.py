@@ -2,17 +2,51 @@
 #    Module `disk`: implements classes `DiskType` and `Disk`.
 #    Peter Sulyok (C) 2022-2024.
 #
-import glob
 import os
-import re
-from typing import List, Tuple, Union
-from pySMART import Device, SMARTCTL
-from diskinfo.utils import _read_file, _read_udev_property, _read_udev_path, size_in_hrf
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import total_ordering
+from typing import TYPE_CHECKING, List, Tuple, Union
+from diskinfo.utils import _read_file, _load_udev, _find_byid_disks, _iter_block_disks, _find_disk_by_udev, \
+    size_in_hrf
 from diskinfo.disktype import DiskType
 from diskinfo.partition import Partition
 from diskinfo.disksmart import DiskSmartData, SmartAttribute, NvmeAttributes
-
-
+if TYPE_CHECKING:
+    from pySMART import Device
+    from pySMART.smartctl import Smartctl
+
+# pySMART is imported only in the methods using it (its import is expensive and it is not needed for the
+# identification of the disks).
+# pylint: disable=import-outside-toplevel
+
+# Names of the disk types (indexed by the disk type values, None for invalid values).
+_TYPE_STR: Tuple[Union[str, None], ...] = tuple({
+    DiskType.HDD: DiskType.HDD_STR,
+    DiskType.SSD: DiskType.SSD_STR,
+    DiskType.NVME: DiskType.NVME_STR,
+    DiskType.LOOP: DiskType.LOOP_STR,
+}.get(i) for i in range(DiskType.LOOP + 1))
+
+# Names of the pySMART NVME attributes (in the order of NvmeAttributes() parameters).
+_NVME_FIELDS = ("criticalWarning", "_temperature", "availableSpare", "availableSpareThreshold", "percentageUsed",
+                "dataUnitsRead", "dataUnitsWritten", "hostReadCommands", "hostWriteCommands", "controllerBusyTime",
+                "powerCycles", "powerOnHours", "unsafeShutdowns", "integrityErrors", "errorEntries",
+                "warningTemperatureTime", "criticalTemperatureTime")
+
+
+def _new_smartctl(options: List[str], sudo: bool, smartctl_path: str) -> "Smartctl":
+    """Creates a new pySMART `Smartctl` object with the specified settings. The object is used only for one call, so
+    concurrent calls with different settings do not interfere with each other."""
+    from pySMART.smartctl import Smartctl
+    smartctl = Smartctl()
+    smartctl.options = options
+    smartctl.sudo = sudo
+    smartctl.smartctl_path = smartctl_path
+    return smartctl
+
+
+@total_ordering
 class Disk:
     """The Disk class contains all disk related information. The class can be initialized with specifying one of the
     five unique identifiers of the disk:
@@ -29,7 +63,8 @@ class Disk:
     Encoding parameter will be used for processing disk attribute strings.
 
     Operators (``<``, ``>`` and ``==``) are also implemented for this class to compare different class instances,
-    they use the disk name for comparison.
+    they use the disk name for comparison. Class instances are hashable (based on the disk name), so they can be
+    used in sets and as dictionary keys.
 
     .. note::
         During the class initialization the disk will not be physically accessed.
@@ -73,6 +108,12 @@ class Disk:
 
     """
 
+    # Disk attributes are stored in slots (no instance dictionary).
+    __slots__ = ("_Disk__name", "_Disk__path", "_Disk__byid_path", "_Disk__bypath_path", "_Disk__wwn", "_Disk__model",
+                 "_Disk__serial_number", "_Disk__firmware", "_Disk__type", "_Disk__size", "_Disk__device_id",
+                 "_Disk__physical_block_size", "_Disk__logical_block_size", "_Disk__part_table_type",
+                 "_Disk__part_table_uuid", "_Disk__hwmon_path", "_Disk__encoding")
+
     # Disk attributes:
     __name: str                         # Disk name (e.g. sda)
     __path: str                         # Disk path (e.g. /dev/sda)
@@ -89,7 +130,7 @@ class Disk:
     __logical_block_size: int           # Disk logical block size
     __part_table_type: str              # Disk partition table type
     __part_table_uuid: str              # Disk partition table UUID
-    __hwmon_path: str                   # Path for the /sys/HWMON temperature file
+    __hwmon_path: str                   # Path for the /sys/HWMON temperature file (None until resolved)
     __encoding: str                     # Character encoding
 
     def __init__(self, disk_name: str = None, serial_number: str = None, wwn: str = None,
@@ -97,7 +138,8 @@ class Disk:
         """See class definition docstring above."""
 
         # Save encoding.
-        self.__encoding = encoding
+        self.__encoding = sys.intern(encoding)
+        udev = None     # Udev data of the disk (if it was loaded during the identification of the disk)
 
         # Initialization 1: disk name.
         if disk_name:
@@ -105,122 +147,139 @@ class Disk:
 
         # Initialization 2: disk serial number.
         elif serial_number:
-            name = ""
-            for file in os.listdir("/sys/block/"):
-                self.__device_id = _read_file("/sys/block/" + file + "/dev", self.__encoding)
-                dev_path = "/run/udev/data/b" + self.__device_id
-                self.__serial_number = _read_udev_property(dev_path, "ID_SERIAL_SHORT=", self.__encoding)
-                if serial_number == self.__serial_number:
-                    name = file
-                    break
+            # Fast path: `by-id` link names end with the serial number (e.g. `ata-<model>_<serial>`).
+            # Slow path: check the udev data of all disks.
+            name, udev = _find_disk_by_udev(_find_byid_disks("_" + serial_number), "ID_SERIAL_SHORT",
+                                            lambda value: value == serial_number, self.__encoding)
+            if name == "":
+                name, udev = _find_disk_by_udev(_iter_block_disks(), "ID_SERIAL_SHORT",
+                                                lambda value: value == serial_number, self.__encoding)
             if name == "":
                 raise ValueError(f"Invalid serial number ({serial_number})!")
             self.__name = name
 
         # Initialization 3: disk WWN name.
         elif wwn:
-            name = ""
-            for file in os.listdir("/sys/block/"):
-                self.__device_id = _read_file("/sys/block/" + file + "/dev", self.__encoding)
-                dev_path = "/run/udev/data/b" + self.__device_id
-                self.__wwn = _read_udev_property(dev_path, "ID_WWN=", self.__encoding)
-                if wwn in self.__wwn:
-                    name = file
-                    break
+            # Fast path: `by-id` link names end with the WWN identifier (e.g. `wwn-<wwn>` or `nvme-<wwn>`).
+            # Slow path: check the udev data of all disks.
+            name, udev = _find_disk_by_udev(_find_byid_disks("-" + wwn), "ID_WWN", lambda value: wwn in value,
+                                            self.__encoding)
+            if name == "":
+                name, udev = _find_disk_by_udev(_iter_block_disks(), "ID_WWN", lambda value: wwn in value,
+                                                self.__encoding)
             if name == "":
                 raise ValueError(f"Invalid wwn identifier ({wwn})!")
             self.__name = name
 
         # Initialization 4: disk `by-id` name.
         elif byid_name:
-            self.__name = os.path.basename(os.readlink("/dev/disk/by-id/" + byid_name))
+            if not os.path.exists("/dev/disk/by-id/" + byid_name):
+                raise ValueError(f"Invalid by-id name ({byid_name})!")
+            self.__name = os.path.basename(os.path.realpath("/dev/disk/by-id/" + byid_name))
 
         # Initialization 5: disk `by-path` name.
         elif bypath_name:
-            self.__name = os.path.basename(os.readlink("/dev/disk/by-path/" + bypath_name))
+            if not os.path.exists("/dev/disk/by-path/" + bypath_name):
+                raise ValueError(f"Invalid by-path name ({bypath_name})!")
+            self.__name = os.path.basename(os.path.realpath("/dev/disk/by-path/" + bypath_name))
 
         # Initialization error (none of them was specified).
         else:
             raise ValueError("Missing disk identifier, Disk() class cannot be initialized.")
 
-        # Check the existence of disk name in /dev and /sys/block folders.
+        # Short, frequently compared or repeated strings are interned (here and below).
+        self.__name = sys.intern(self.__name)
+
+        # Check the existence of disk name in /dev folder.
         self.__path = "/dev/" + self.__name
         if not os.path.exists(self.__path):
             raise ValueError(f"Disk path ({self.__path}) does not exist!")
-        path = "/sys/block/" + self.__name
-        if not os.path.exists(path):
-            raise ValueError(f"Disk path ({self.__path}) does not exist!")
 
-        # Read disk attributes from /sys filesystem.
-        self.__size = int(_read_file("/sys/block/" + self.__name + "/size", self.__encoding))
-        self.__model = _read_file("/sys/block/" + self.__name + "/device/model", self.__encoding)
-        self.__device_id = _read_file("/sys/block/" + self.__name + "/dev", self.__encoding)
-        self.__physical_block_size = int(_read_file("/sys/block/" + self.__name + "/queue/physical_block_size",
-                                                    self.__encoding))
-        self.__logical_block_size = int(_read_file("/sys/block/" + self.__name + "/queue/logical_block_size",
-                                                   self.__encoding))
-
-        # Determination of the disk type (HDD, SSD, NVME or LOOP)
-        # Type: LOOP
-        if re.match(r'^7:', self.__device_id):
-            self.__type = DiskType.LOOP
-
-        # Type: NVME
-        elif "nvme" in self.__name:
-            self.__type = DiskType.NVME
-
-        # Type: SSD or HDD
-        else:
-            path = "/sys/block/" + self.__name + "/queue/rotational"
-            result = _read_file(path, self.__encoding)
-            if result == "1":
-                self.__type = DiskType.HDD
-            elif result == "0":
-                self.__type = DiskType.SSD
+        # Open the /sys/block/<name> folder once, disk attributes will be read relative to this folder. The folder
+        # is only used as a path anchor (O_PATH), so it is not opened for reading.
+        sys_path = "/sys/block/" + self.__name
+        try:
+            block_fd = os.open(sys_path, os.O_PATH | os.O_DIRECTORY)
+        except OSError as e:
+            raise ValueError(f"Disk path ({sys_path}) does not exist!") from e
+        try:
+            # Read disk attributes from /sys filesystem.
+            self.__device_id = sys.intern(_read_file("dev", self.__encoding, dir_fd=block_fd))
+            self.__size = int(_read_file("size", self.__encoding, dir_fd=block_fd))
+            # LOOP disks do not have a `device` folder (i.e. model and HWMON).
+            is_loop = self.__device_id.startswith("7:")
+            self.__model = "" if is_loop else _read_file("device/model", self.__encoding, dir_fd=block_fd)
+            self.__physical_block_size = int(_read_file("queue/physical_block_size", self.__encoding,
+                                                        dir_fd=block_fd))
+            self.__logical_block_size = int(_read_file("queue/logical_block_size", self.__encoding,
+                                                       dir_fd=block_fd))
+
+            # Determination of the disk type (HDD, SSD, NVME or LOOP)
+            # Type: LOOP
+            if is_loop:
+                self.__type = DiskType.LOOP
+
+            # Type: NVME
+            elif self.__name.startswith("nvme"):
+                self.__type = DiskType.NVME
+
+            # Type: SSD or HDD
             else:
-                raise RuntimeError(f"Disk type cannot be determined based on this value ({path}={result}).")
-
-        # Read attributes from udev data.
-        dev_path = "/run/udev/data/b" + self.__device_id
-        self.__serial_number = _read_udev_property(dev_path, "ID_SERIAL_SHORT=", self.__encoding)
-        self.__firmware = _read_udev_property(dev_path, "ID_REVISION=", self.__encoding)
-        self.__wwn = _read_udev_property(dev_path, "ID_WWN=", self.__encoding)
-        self.__part_table_type = _read_udev_property(dev_path, "ID_PART_TABLE_TYPE=", self.__encoding)
-        self.__part_table_uuid = _read_udev_property(dev_path, "ID_PART_TABLE_UUID=", self.__encoding)
-        model = _read_udev_property(dev_path, "ID_MODEL_ENC=", self.__encoding)
-        if model:
-            self.__model = model
-
-        # Read `/dev/disk/by-byid/` path elements from udev and check their existence.
-        self.__byid_path = _read_udev_path(dev_path, 0, self.__encoding)
+                result = _read_file("queue/rotational", self.__encoding, dir_fd=block_fd)
+                if result == "1":
+                    self.__type = DiskType.HDD
+                elif result == "0":
+                    self.__type = DiskType.SSD
+                else:
+                    raise RuntimeError(f"Disk type cannot be determined based on this value "
+                                       f"({sys_path}/queue/rotational={result}).")
+        finally:
+            os.close(block_fd)
+
+        # Read attributes from udev data (the file is loaded only once, it may be loaded already during the
+        # identification of the disk).
+        if udev is None:
+            udev = _load_udev("/run/udev/data/b" + self.__device_id, self.__encoding)
+        props, links = udev
+        self.__byid_path = links.get("by-id", [])
+        self.__bypath_path = links.get("by-path", [])
+        self.__serial_number = props.get("ID_SERIAL_SHORT", "")
+        self.__firmware = sys.intern(props.get("ID_REVISION", ""))
+        self.__wwn = props.get("ID_WWN", "")
+        self.__part_table_type = sys.intern(props.get("ID_PART_TABLE_TYPE", ""))
+        self.__part_table_uuid = props.get("ID_PART_TABLE_UUID", "")
+        self.__model = sys.intern(props.get("ID_MODEL_ENC", "") or self.__model)
+
+        # Check the existence of `/dev/disk/by-byid/` path elements.
         for file_name in self.__byid_path:
             if not os.path.exists(file_name):
                 raise RuntimeError(f"Disk by-id path ({file_name}) does not exist!")
 
-        # Read `/dev/disk/by-path/` path elements from udev and check their existence.
-        self.__bypath_path = _read_udev_path(dev_path, 1, self.__encoding)
+        # Check the existence of `/dev/disk/by-path/` path elements.
         for file_name in self.__bypath_path:
             if not os.path.exists(file_name):
                 raise RuntimeError(f"Disk by-path path ({file_name}) does not exist!")
 
-        # Find the path for HWMON file of the disk.
+        # The path of the HWMON file will be resolved at the first get_temperature() call (LOOP disks do not have
+        # HWMON file).
+        self.__hwmon_path = "" if is_loop else None
+
+    def __find_hwmon_path(self) -> str:
+        """Finds the path of the HWMON temperature file of the disk. Returns an empty string if not found."""
+        sys_path = "/sys/block/" + self.__name
+
         # Step 1: Check typical HWMON path for HDD, SSD disks
-        path = "/sys/block/" + self.__name + "/device/hwmon/hwmon*/temp1_input"
-        file_names = glob.glob(path)
-        if file_names and os.path.exists(file_names[0]):
-            self.__hwmon_path = file_names[0]
-        else:
-            # Step 2: Check HWMON path for NVME disks in Linux kernel 5.10-5.18?
-            path = "/sys/block/" + self.__name + "/device/device/hwmon/hwmon*/temp1_input"
-            file_names = glob.glob(path)
-            if file_names and os.path.exists(file_names[0]):
-                self.__hwmon_path = file_names[0]
-            else:
-                # Step 3: Check HWMON path for NVME disks in Linux kernel 5.19+?
-                path = "/sys/block/" + self.__name + "/device/hwmon*/temp1_input"
-                file_names = glob.glob(path)
-                if file_names and os.path.exists(file_names[0]):
-                    self.__hwmon_path = file_names[0]
+        # Step 2: Check HWMON path for NVME disks in Linux kernel 5.10-5.18?
+        # Step 3: Check HWMON path for NVME disks in Linux kernel 5.19+?
+        for folder in (f"{sys_path}/device/hwmon", f"{sys_path}/device/device/hwmon", f"{sys_path}/device"):
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("hwmon") and os.path.exists(entry.path + "/temp1_input"):
+                            return entry.path + "/temp1_input"
+            except OSError:
+                pass
+        return ""
 
     def get_name(self) -> str:
         """Returns the disk name.
@@ -380,7 +439,7 @@ class Disk:
                 True
 
         """
-        return bool(self.__type == DiskType.SSD)
+        return self.__type == DiskType.SSD
 
     def is_nvme(self) -> bool:
         """Returns `True` if the disk type is NVME, otherwise `False`.
@@ -394,7 +453,7 @@ class Disk:
                 False
 
         """
-        return bool(self.__type == DiskType.NVME)
+        return self.__type == DiskType.NVME
 
     def is_hdd(self) -> bool:
         """Returns `True` if the disk type is HDD, otherwise `False`.
@@ -408,7 +467,7 @@ class Disk:
                 False
 
         """
-        return bool(self.__type == DiskType.HDD)
+        return self.__type == DiskType.HDD
 
     def is_loop(self) -> bool:
         """Returns `True` if the disk type is LOOP, otherwise `False`.
@@ -422,7 +481,7 @@ class Disk:
                 True
 
         """
-        return bool(self.__type == DiskType.LOOP)
+        return self.__type == DiskType.LOOP
 
     def get_type_str(self) -> str:
         """Returns the name of the disk type. See the return values in :class:`~diskinfo.DiskType` class:
@@ -444,15 +503,10 @@ class Disk:
                 'SSD'
 
         """
-        if self.is_nvme():
-            return DiskType.NVME_STR
-        if self.is_ssd():
-            return DiskType.SSD_STR
-        if self.is_hdd():
-            return DiskType.HDD_STR
-        if self.is_loop():
-            return DiskType.LOOP_STR
-        raise RuntimeError(f'Unknown disk type (type={self.__type})')
+        name = _TYPE_STR[self.__type] if 0 <= self.__type < len(_TYPE_STR) else None
+        if name is None:
+            raise RuntimeError(f'Unknown disk type (type={self.__type})')
+        return name
 
     def get_size(self) -> int:
         """Returns the size of the disk in 512-byte units.
@@ -605,26 +659,30 @@ class Disk:
                 28.5
 
         """
-        temp:   float
-        sd:     Device
+        temp:       float
+        sd:         "Device"
+        smartctl:   "Smartctl"
+
+        # Ignore loop disks.
+        if self.__type == DiskType.LOOP:
+            return None
+
+        # Find the HWMON file of the disk at the first call.
+        if self.__hwmon_path is None:
+            self.__hwmon_path = self.__find_hwmon_path()
 
         # Read disk temperature from HWMON system of the Linux kernel.
-        if hasattr(self, '_Disk__hwmon_path') and \
-           self.__hwmon_path and \
-           os.path.exists(self.__hwmon_path):
+        if self.__hwmon_path:
             try:
                 return float(_read_file(self.__hwmon_path, self.__encoding)) / 1000.0
             except ValueError:
                 pass
 
-        # Read disk temperature from `smartctl` command.
-        SMARTCTL.options = []
-        SMARTCTL.smartctl_path = smartctl_path
-        if sudo:
-            SMARTCTL.sudo = True
-        else:
-            SMARTCTL.sudo = False
-        sd = Device(self.__path)
+        # Read disk temperature from `smartctl` command (a separate `Smartctl` object is used for the call, so the
+        # global `SMARTCTL` settings of pySMART are not changed).
+        from pySMART import Device
+        smartctl = _new_smartctl([], sudo, smartctl_path)
+        sd = Device(self.__path, smartctl=smartctl)
         temp = sd.temperature
         if not temp:
             return None
@@ -689,30 +747,24 @@ class Disk:
                 Power on hours: 1565 h
 
         """
-        sd: Device          # Device class created by pySMART
-        rv: DiskSmartData   # return value
+        sd: "Device"            # Device class created by pySMART
+        smartctl: "Smartctl"    # Smartctl class created for this call
+        rv: DiskSmartData       # return value
 
         # Ignore loop disks.
         if self.is_loop():
             return None
 
+        from pySMART import Device
         rv = DiskSmartData()
         rv.standby_mode = False
-        SMARTCTL.options = []
-        SMARTCTL.smartctl_path = smartctl_path
 
-        # If sudo command should be used
-        if sudo:
-            SMARTCTL.sudo = True
-        else:
-            SMARTCTL.sudo = False
-
-        # If no check should be applied in standby power mode of an HDD
-        if nocheck:
-            SMARTCTL.add_options(["-n", "standby"])
+        # A separate `Smartctl` object is used for the call (no check should be applied in standby power mode of an
+        # HDD if `nocheck` is set), so the global `SMARTCTL` settings of pySMART are not changed.
+        smartctl = _new_smartctl(["-n", "standby"] if nocheck else [], sudo, smartctl_path)
 
         # Check if `smartctl` can be executed.
-        output = SMARTCTL.info(self.__path)
+        output = smartctl.info(self.__path)
         if not output:
             return None
 
@@ -722,7 +774,7 @@ class Disk:
             return rv
 
         # Get SMART data from pySMART.
-        sd = Device(self.__path)
+        sd = Device(self.__path, smartctl=smartctl)
 
         # Check if the device interface was not identified (i.e. unknown device).
         if not sd.interface:
@@ -741,56 +793,57 @@ class Disk:
         # Read and store of NVME attributes
         if self.is_nvme():
             if hasattr(sd, "if_attributes"):
-                rv.nvme_attributes = NvmeAttributes(
-                    sd.if_attributes.criticalWarning
-                    if hasattr(sd.if_attributes, "criticalWarning") else None,
-                    sd.if_attributes._temperature
-                    if hasattr(sd.if_attributes, "_temperature") else None,
-                    sd.if_attributes.availableSpare
-                    if hasattr(sd.if_attributes, "availableSpare") else None,
-                    sd.if_attributes.availableSpareThreshold
-                    if hasattr(sd.if_attributes, "availableSpareThreshold") else None,
-                    sd.if_attributes.percentageUsed
-                    if hasattr(sd.if_attributes, "percentageUsed") else None,
-                    sd.if_attributes.dataUnitsRead
-                    if hasattr(sd.if_attributes, "dataUnitsRead") else None,
-                    sd.if_attributes.dataUnitsWritten
-                    if hasattr(sd.if_attributes, "dataUnitsWritten") else None,
-                    sd.if_attributes.hostReadCommands
-                    if hasattr(sd.if_attributes, "hostReadCommands") else None,
-                    sd.if_attributes.hostWriteCommands
-                    if hasattr(sd.if_attributes, "hostWriteCommands") else None,
-                    sd.if_attributes.controllerBusyTime
-                    if hasattr(sd.if_attributes, "controllerBusyTime") else None,
-                    sd.if_attributes.powerCycles
-                    if hasattr(sd.if_attributes, "powerCycles") else None,
-                    sd.if_attributes.powerOnHours
-                    if hasattr(sd.if_attributes, "powerOnHours") else None,
-                    sd.if_attributes.unsafeShutdowns
-                    if hasattr(sd.if_attributes, "unsafeShutdowns") else None,
-                    sd.if_attributes.integrityErrors
-                    if hasattr(sd.if_attributes, "integrityErrors") else None,
-                    sd.if_attributes.errorEntries
-                    if hasattr(sd.if_attributes, "errorEntries") else None,
-                    sd.if_attributes.warningTemperatureTime
-                    if hasattr(sd.if_attributes, "warningTemperatureTime") else None,
-                    sd.if_attributes.criticalTemperatureTime
-                    if hasattr(sd.if_attributes, "criticalTemperatureTime") else None
-                )
+                rv.nvme_attributes = NvmeAttributes(*[getattr(sd.if_attributes, name, None) for name in _NVME_FIELDS])
 
         # Read and save SATA attributes
         else:
             if hasattr(sd, "if_attributes") and hasattr(sd.if_attributes, "legacyAttributes"):
-                rv.smart_attributes = []
-                for i in sd.if_attributes.legacyAttributes:
-                    if i:
-                        rv.smart_attributes.append(SmartAttribute(
-                            i.num, i.name, i.flags, i.value_int, i.worst, i.thresh, i.type, i.updated,
-                            i.when_failed, i.raw_int)
-                        )
+                rv.smart_attributes = [
+                    SmartAttribute(i.num, i.name, i.flags, i.value_int, i.worst, i.thresh, i.type, i.updated,
+                                   i.when_failed, i.raw_int)
+                    for i in sd.if_attributes.legacyAttributes if i
+                ]
 
         return rv
 
+    @staticmethod
+    def get_smart_data_bulk(disks: List["Disk"], nocheck: bool = False, sudo: bool = False,
+                            smartctl_path: str = "/usr/sbin/smartctl", max_workers: int = 8) \
+            -> List[Union[DiskSmartData, None]]:
+        """Returns SMART data of several disks. The :meth:`~diskinfo.Disk.get_smart_data()` method will be called
+        for the disks in parallel (in a thread pool), so the execution of the ``smartctl`` commands will overlap.
+
+        Args:
+            disks (List[Disk]): list of disks
+            nocheck (bool):  No check should be applied for a HDDs (``"-n standby"`` argument will be used)
+            sudo (bool): ``sudo`` command should be used, default value is ``False``
+            smartctl_path (str): Path for ``smartctl`` command, default value is ``/usr/sbin/smartctl``
+            max_workers (int): maximum number of parallel threads, default value is 8
+
+        Returns:
+            List[DiskSmartData]: SMART information of the disks in the order of the input list (an item is None if
+            `smartctl` cannot be executed for the disk)
+
+        Example:
+            An example about the use of this function::
+
+                >>> from diskinfo import Disk, DiskInfo
+                >>> di = DiskInfo()
+                >>> disks = di.get_disk_list(sorting=True)
+                >>> for d, sd in zip(disks, Disk.get_smart_data_bulk(disks, sudo=True)):
+                ...     print(d.get_name(), sd.healthy if sd else None)
+                ...
+                nvme0n1 True
+                sda True
+                sdb True
+
+        """
+        if not disks:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(disks)))) as executor:
+            return list(executor.map(lambda d: d.get_smart_data(nocheck=nocheck, sudo=sudo,
+                                                                smartctl_path=smartctl_path), disks))
+
     def get_partition_list(self) -> List[Partition]:
         """Reads partition information of the disk and returns the list of partitions. See
         :class:`~diskinfo.Partition` class for more details for a partition entry.
@@ -813,30 +866,58 @@ class Disk:
             nvme0n1p6
 
         """
-        result: List[Partition] = []
-        index = 1
-        while True:
-            path = "/sys/block/" + self.__name + "/" + self.__name
-            if self.is_nvme():
-                path += "p"
-            path += str(index)
-            if not os.path.exists(path):
-                break   # If partition path dos not exists.
-            result.append(Partition(os.path.basename(path), _read_file(path + "/dev", self.__encoding)))
-            index += 1
-        return result
-
-    def __gt__(self, other) -> bool:
-        """Implementation of '>' operator for Disk class."""
-        return bool(self.__name > other.__name)
+        numbers: List[int] = []     # Partition numbers
+
+        # Collect partition numbers with a single scan of the disk folder (partition folders are named as
+        # <disk name>[p]<number>).
+        prefix = self.__name + "p" if self.is_nvme() else self.__name
+        sys_path = "/sys/block/" + self.__name + "/"
+        try:
+            with os.scandir(sys_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.name[len(prefix):].isdigit():
+                        numbers.append(int(entry.name[len(prefix):]))
+        except OSError:
+            return []
+
+        # Create partitions in the order of their numbers (their `dev` files are read relative to the disk folder).
+        if not numbers:
+            return []
+        numbers.sort()
+        try:
+            block_fd = os.open(sys_path, os.O_PATH | os.O_DIRECTORY)
+        except OSError:
+            return []
+        try:
+            return [Partition(prefix + str(n), _read_file(prefix + str(n) + "/dev", self.__encoding, dir_fd=block_fd))
+                    for n in numbers]
+        finally:
+            os.close(block_fd)
 
     def __lt__(self, other) -> bool:
-        """Implementation of '<' operator for Disk class."""
-        return bool(self.__name < other.__name)
+        """Implementation of '<' operator for Disk class (other operators are derived by `total_ordering`)."""
+        if not isinstance(other, Disk):
+            return NotImplemented
+        return self.__name < other.__name
 
     def __eq__(self, other) -> bool:
         """Implementation of '==' operator for Disk class."""
-        return bool(self.__name == other.__name)
+        if not isinstance(other, Disk):
+            return NotImplemented
+        return self.__name == other.__name
+
+    def __hash__(self) -> int:
+        """Implementation of hash() for Disk class (it is consistent with '==' operator)."""
+        return hash(self.__name)
+
+    def __copy__(self) -> "Disk":
+        """Returns a new, independent copy of the disk (path lists are copied)."""
+        new = Disk.__new__(Disk)
+        for name in Disk.__slots__:
+            if hasattr(self, name):
+                value = getattr(self, name)
+                setattr(new, name, list(value) if isinstance(value, list) else value)
+        return new
 
     def __repr__(self):
         """String representation of the Disk class."""
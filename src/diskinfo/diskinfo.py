@@ -2,10 +2,29 @@
 #    Module `diskinfo`: implements class `DiskInfo`.
 #    Peter Sulyok (C) 2022-2024.
 #
+import copy
 import os
+import time
 from typing import List
 from diskinfo.disktype import DiskType
 from diskinfo.disk import Disk
+from diskinfo.utils import _read_file
+
+# Cache of the last disk enumeration (used only by DiskInfo instances created with `cache=True`).
+_ENUM_CACHE: dict = {"ts": 0.0, "names": None, "disks": []}
+_ENUM_CACHE_TTL: float = 2.0
+
+# Bit mask of all disk types.
+_ALL_TYPES: int = DiskType.HDD | DiskType.SSD | DiskType.NVME | DiskType.LOOP
+
+
+def _to_mask(disk_types: set) -> int:
+    """Converts a set of :class:`~diskinfo.DiskType` values to a bit mask."""
+    mask = 0
+    if disk_types:
+        for disk_type in disk_types:
+            mask |= disk_type
+    return mask
 
 
 class DiskInfo:
@@ -16,9 +35,19 @@ class DiskInfo:
     In both cases disk type filters can be applied to get only a subset of the discovered disks. The filters are
     set of :class:`~diskinfo.DiskType` values.
 
+    Disks rarely change, so the result of the exploration can be cached for a short time (2 seconds) with the
+    `cache` parameter. A cached result is reused by subsequent class instances (also created with `cache=True`)
+    only if the list of the disks in `/sys/block` is unchanged, and new copies of the cached
+    :class:`~diskinfo.Disk` instances are returned. A disk replaced by another one with the same name within the
+    cache time will not be detected.
+
     Operator ``in`` is also implemented for this class. Caller can check if a :class:`~diskinfo.Disk` class instance
     can be found on the list of the identified disks.
 
+    Args:
+        cache (bool): reuse the cached result of a previous exploration if it is still valid, and save the result
+                      of this exploration into the cache (default is `False`)
+
     Example:
         A code example about the basic use of the class and the use of the ``in`` operator.
 
@@ -34,18 +63,27 @@ class DiskInfo:
 
     __disk_list: List[Disk]           # List of discovered disks.
 
-    def __init__(self):
+    def __init__(self, cache: bool = False):
         """See class definition."""
 
-        # Initialize class variables.
-        self.__disk_list = []
+        # Collect the list of block devices with a single directory scan. Empty loop devices are skipped here
+        # (based on their `size` file), so no Disk() instance will be created for them.
+        with os.scandir('/sys/block') as entries:
+            disk_names = sorted(entry.name for entry in entries if entry.is_dir(follow_symlinks=True) and
+                                not (entry.name.startswith("loop") and _read_file(entry.path + "/size") == "0"))
 
-        # Iterate on list of block devices.
-        for file_name in os.listdir('/sys/block'):
-            new_disk = Disk(disk_name=file_name)
-            # Empty loop devices are skipped
-            if not (new_disk.is_loop() and new_disk.get_size() == 0):
-                self.__disk_list.append(new_disk)
+        # Reuse the cached disks (as new copies) if the list of the disks is unchanged and the cache is still valid.
+        now = time.monotonic()
+        if cache and disk_names == _ENUM_CACHE["names"] and now - _ENUM_CACHE["ts"] < _ENUM_CACHE_TTL:
+            self.__disk_list = [copy.copy(disk) for disk in _ENUM_CACHE["disks"]]
+            return
+
+        # Create Disk() instances (the disk list is sorted by name, so sorted queries will not need further sorting).
+        self.__disk_list = [Disk(disk_name=name) for name in disk_names]
+
+        # Save the result into the cache (the cache keeps its own copies).
+        if cache:
+            _ENUM_CACHE.update(ts=now, names=disk_names, disks=[copy.copy(disk) for disk in self.__disk_list])
 
     def get_disk_number(self, included: set = None, excluded: set = None) -> int:
         """Returns the number of the disks. The caller can specify inclusive and exclusive filters for disk types.
@@ -70,26 +108,17 @@ class DiskInfo:
             >>> print(f"Number of SSDs: {n}")
             Number of SSDs: 3
         """
-        disk_number: int    # Number of disk counted
-
-        # Set the default filter if not specified.
-        if not included:
-            included = {DiskType.HDD, DiskType.SSD, DiskType.NVME, DiskType.LOOP}
-        if not excluded:
-            excluded = set()
+        # Convert the filters to bit masks (the default filter includes everything and excludes nothing).
+        included_mask = _to_mask(included) if included else _ALL_TYPES
+        excluded_mask = _to_mask(excluded)
 
         # Check invalid filters.
-        if included.intersection(excluded):
+        if included_mask & excluded_mask:
             raise ValueError("Parameter error: same value on included and excluded list.")
 
         # Count number of disks based on the specified filters.
-        disk_number = 0
-        for disk in self.__disk_list:
-            disk_type = disk.get_type()
-            if disk_type in included and disk_type not in excluded:
-                disk_number += 1
-
-        return disk_number
+        return sum(1 for disk in self.__disk_list
+                   if disk.get_type() & included_mask and not disk.get_type() & excluded_mask)
 
     def get_disk_list(self, included: set = None, excluded: set = None, sorting: bool = False,
                       rev_order: bool = False) -> List[Disk]:
@@ -124,27 +153,23 @@ class DiskInfo:
             /dev/sdb
             /dev/sdc
         """
-        result: List[Disk] = []
+        result: List[Disk]      # List of the selected disks
 
-        # Set default filters if not specified.
-        if not included:
-            included = {DiskType.HDD, DiskType.SSD, DiskType.NVME, DiskType.LOOP}
-        if not excluded:
-            excluded = set()
+        # Convert the filters to bit masks (the default filter includes everything and excludes nothing).
+        included_mask = _to_mask(included) if included else _ALL_TYPES
+        excluded_mask = _to_mask(excluded)
 
         # Check invalid filters.
-        if included.intersection(excluded):
+        if included_mask & excluded_mask:
             raise ValueError("Parameter error: same value on included and excluded list.")
 
         # Collect selected disks based on the specified filters.
-        for disk in self.__disk_list:
-            disk_type = disk.get_type()
-            if disk_type in included and disk_type not in excluded:
-                result.append(disk)
+        result = [disk for disk in self.__disk_list
+                  if disk.get_type() & included_mask and not disk.get_type() & excluded_mask]
 
-        # Sort the result list if needed.
-        if sorting:
-            result.sort(reverse=rev_order)
+        # The disk list is already sorted by name, reverse it if needed.
+        if sorting and rev_order:
+            result.reverse()
 
         return result
 
@@ -6,7 +6,7 @@ import os.path
 import subprocess
 import re
 from typing import List, Tuple
-from diskinfo.utils import _read_udev_property, _read_udev_path, size_in_hrf
+from diskinfo.utils import _load_udev, size_in_hrf
 
 
 class Partition:
@@ -46,6 +46,15 @@ class Partition:
 
     """
 
+    # Partition attributes are stored in slots (no instance dictionary).
+    __slots__ = ("_Partition__name", "_Partition__path", "_Partition__byid_path", "_Partition__bypath_path",
+                 "_Partition__bypartuuid_path", "_Partition__bypartlabel_path", "_Partition__bylabel_path",
+                 "_Partition__byuuid_path", "_Partition__part_dev_id", "_Partition__part_scheme",
+                 "_Partition__part_label", "_Partition__part_uuid", "_Partition__part_type", "_Partition__part_number",
+                 "_Partition__part_offset", "_Partition__part_size", "_Partition__fs_label", "_Partition__fs_uuid",
+                 "_Partition__fs_type", "_Partition__fs_version", "_Partition__fs_usage", "_Partition__fs_free_size",
+                 "_Partition__fs_mounting_point")
+
     # Partition attributes.
     __name: str                         # Partition name (e.g. sda1)
     __path: str                         # Partition path (e.g. /dev/sda1)
@@ -81,63 +90,36 @@ class Partition:
         path = "/run/udev/data/b" + dev_id
         if not os.path.exists(path):
             raise ValueError(f"Partition udev data file ({path}) does not exist.")
-        # by-id path elements
-        self.__byid_path = _read_udev_path(path, 0)
-        # by-path path
-        self.__bypath_path = ""
-        path_list = _read_udev_path(path, 1)
-        if path_list:
-            self.__bypath_path = path_list[0]
-        # by-partuuid path
-        self.__bypartuuid_path = ""
-        path_list = _read_udev_path(path, 2)
-        if path_list:
-            self.__bypartuuid_path = path_list[0]
-        # by-partlabel path
-        self.__bypartlabel_path = ""
-        path_list = _read_udev_path(path, 3)
-        if path_list:
-            self.__bypartlabel_path = path_list[0]
-        # by-label path
-        self.__bylabel_path = ""
-        path_list = _read_udev_path(path, 4)
-        if path_list:
-            self.__bylabel_path = path_list[0]
-        # by-uuid path
-        self.__byuuid_path = ""
-        path_list = _read_udev_path(path, 5)
-        if path_list:
-            self.__byuuid_path = path_list[0]
+        # Load udev properties and all path elements with a single read.
+        props, links = _load_udev(path)
+        self.__byid_path = links.get("by-id", [])
+        self.__bypath_path = links.get("by-path", [""])[0]
+        self.__bypartuuid_path = links.get("by-partuuid", [""])[0]
+        self.__bypartlabel_path = links.get("by-partlabel", [""])[0]
+        self.__bylabel_path = links.get("by-label", [""])[0]
+        self.__byuuid_path = links.get("by-uuid", [""])[0]
         # other udev properties
-        self.__part_scheme = _read_udev_property(path, "ID_PART_ENTRY_SCHEME=")
-        self.__part_label = _read_udev_property(path, "ID_PART_ENTRY_NAME=")
-        self.__part_uuid = _read_udev_property(path, "ID_PART_ENTRY_UUID=")
-        self.__part_type = _read_udev_property(path, "ID_PART_ENTRY_TYPE=")
+        self.__part_scheme = props.get("ID_PART_ENTRY_SCHEME", "")
+        self.__part_label = props.get("ID_PART_ENTRY_NAME", "")
+        self.__part_uuid = props.get("ID_PART_ENTRY_UUID", "")
+        self.__part_type = props.get("ID_PART_ENTRY_TYPE", "")
         self.__part_number = 0
-        value = _read_udev_property(path, "ID_PART_ENTRY_NUMBER=")
+        value = props.get("ID_PART_ENTRY_NUMBER")
         if value:
             self.__part_number = int(value)
         self.__part_offset = -1
-        value = _read_udev_property(path, "ID_PART_ENTRY_OFFSET=")
+        value = props.get("ID_PART_ENTRY_OFFSET")
         if value:
             self.__part_offset = int(value)
         self.__part_size = 0
-        value = _read_udev_property(path, "ID_PART_ENTRY_SIZE=")
+        value = props.get("ID_PART_ENTRY_SIZE")
         if value:
             self.__part_size = int(value)
-        value = _read_udev_property(path, "ID_FS_LABEL_ENC=")
-        if value:
-            self.__fs_label = value
-        else:
-            self.__fs_label = _read_udev_property(path, "ID_FS_LABEL=")
-        value = _read_udev_property(path, "ID_FS_UUID_ENC=")
-        if value:
-            self.__fs_uuid = value
-        else:
-            self.__fs_uuid = _read_udev_property(path, "ID_FS_UUID=")
-        self.__fs_type = _read_udev_property(path, "ID_FS_TYPE=")
-        self.__fs_version = _read_udev_property(path, "ID_FS_VERSION=")
-        self.__fs_usage = _read_udev_property(path, "ID_FS_USAGE=")
+        self.__fs_label = props.get("ID_FS_LABEL_ENC") or props.get("ID_FS_LABEL", "")
+        self.__fs_uuid = props.get("ID_FS_UUID_ENC") or props.get("ID_FS_UUID", "")
+        self.__fs_type = props.get("ID_FS_TYPE", "")
+        self.__fs_version = props.get("ID_FS_VERSION", "")
+        self.__fs_usage = props.get("ID_FS_USAGE", "")
         self.__fs_mounting_point = ""
         self.__fs_free_size = 0
 
@@ -2,17 +2,46 @@
 #    Module `utils`: implements utility functions.
 #    Peter Sulyok (C) 2022-2024.
 #
-from typing import List, Tuple
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
+# Line prefixes of the udev data file processed by _parse_udev().
+_UDEV_PREFIXES: Tuple[bytes, ...] = (b"E:", b"S:disk/by-")
 
-def _read_file(path, encoding: str = "utf-8") -> str:
+# Path elements of the udev data file searched by _read_udev_path() (indexed by the path type).
+_UDEV_PATH_TYPES: Tuple[bytes, ...] = (b"disk/by-id/", b"disk/by-path/", b"disk/by-partuuid/", b"disk/by-partlabel/",
+                                       b"disk/by-label/", b"disk/by-uuid/")
+
+# Parsed udev data files (the key is the path, encoding and the identity of the file content: modification time,
+# size and inode), used by _load_udev().
+_UDEV_CACHE: Dict[tuple, Tuple[Dict[str, str], Dict[str, List[str]]]] = {}
+_UDEV_CACHE_SIZE: int = 1024
+
+# Size units (metric, IEC and legacy) used by size_in_hrf().
+_SIZE_UNITS: Tuple[Tuple[str, ...], ...] = (
+    ("B", "kB", "MB", "GB", "TB", "PB", "EB"),
+    ("B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB"),
+    ("B", "KB", "MB", "GB", "TB", "PB", "EB"),
+)
+
+# Time units and dividers used by time_in_hrf().
+_TIME_LONG_UNITS: Tuple[str, ...] = ("second", "minute", "hour", "day", "year")
+_TIME_SHORT_UNITS: Tuple[str, ...] = ("s", "min", "h", "d", "yr")
+_TIME_DIVIDERS: Tuple[int, ...] = (60, 60, 24, 365, 1)
+
+
+def _read_file(path, encoding: str = "utf-8", dir_fd: int = None) -> str:
     """Reads the text content of the specified file. The function will hide :py:obj:`IOError` and
     :py:obj:`FileNotFound` exceptions during the file operations. The result bytes will be read with the specified
-    encoding and stripped.
+    encoding and stripped. The file is read with low-level :py:func:`os.open` and :py:func:`os.read` calls
+    (without Python I/O buffering), since typical sysfs attribute files are very small (they are read with a single
+    :py:func:`os.read` call, reading stops at the first short read).
 
     Args:
         path (str): file path
         encoding (str): encoding (default is `utf-8`)
+        dir_fd (int): file descriptor of an opened folder, `path` will be relative to this folder (default is
+                      `None`)
 
     Returns:
         str: file content text
@@ -25,13 +54,19 @@ def _read_file(path, encoding: str = "utf-8") -> str:
             '8:0'
 
     """
-    result: str = ""
+    data: bytes = b""
     try:
-        with open(path, "rt", encoding=encoding) as file:
-            result = file.read().strip()
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC, dir_fd=dir_fd)
+        try:
+            while chunk := os.read(fd, 4096):
+                data += chunk
+                if len(chunk) < 4096:
+                    break
+        finally:
+            os.close(fd)
     except (IOError, FileNotFoundError):
         pass
-    return result
+    return data.decode(encoding, "replace").strip()
 
 
 def _read_udev_property(path: str, udev_property: str, encoding: str = "utf-8") -> str:
@@ -57,8 +92,8 @@ def _read_udev_property(path: str, udev_property: str, encoding: str = "utf-8")
             'WDS100T1X0E-00AFY0'
 
     """
-    file_content: List[str] = []
-    result: str = ""
+    data: bytes = b""
+    result: bytes = b""
 
     # Validate input parameters.
     if not path:
@@ -66,22 +101,21 @@ def _read_udev_property(path: str, udev_property: str, encoding: str = "utf-8")
     if not udev_property:
         raise ValueError("Invalid empty property.")
 
-    # Read proper udev data file.
+    # Read proper udev data file as bytes, find the first occurrence of the specified udev_property and copy its
+    # value until the end of the line (only the value will be decoded).
     try:
-        with open(path, "rt", encoding=encoding) as file:
-            file_content = file.read().splitlines()
+        with open(path, "rb", buffering=0) as file:
+            data = file.read()
     except (IOError, FileNotFoundError):
         pass
-
-    # Find the specified udev_property and copy its value.
-    for line in file_content:
-        pos = line.find(udev_property)
-        if pos != -1:
-            result = line[pos + len(udev_property):]
-            break
+    prop = udev_property.encode(encoding)
+    pos = data.find(prop)
+    if pos != -1:
+        result = data[pos + len(prop):].split(b"\n", 1)[0]
 
     # Replace encoded space characters and strip the result string.
-    return result.replace("\\x20", " ").strip()
+    return result.decode(encoding, "replace").replace("\\x20", " ").strip()
+
 
 def _read_udev_path(path: str, path_type: int, encoding: str = "utf-8") -> List[str]:
     """Reads one or more path elements from an udev data file. It will hide :py:obj:`IOError` and
@@ -115,9 +149,8 @@ def _read_udev_path(path: str, path_type: int, encoding: str = "utf-8") -> List[
             ['/dev/disk/by-path/pci-0000:02:00.0-nvme-1']
 
     """
-    file_content: List[str] = []
+    data: bytes = b""
     result: List[str] = []
-    udev_property: str = ""
 
     # Validate input parameters.
     if not path:
@@ -125,34 +158,155 @@ def _read_udev_path(path: str, path_type: int, encoding: str = "utf-8") -> List[
     if path_type not in (0, 1, 2, 3, 4, 5):
         raise ValueError(f"Invalid path type ({path_type}).")
 
-    # Read proper udev data file.
+    # Read proper udev data file as bytes.
     try:
-        with open(path, "rt", encoding=encoding) as file:
-            file_content = file.read().splitlines()
+        with open(path, "rb", buffering=0) as file:
+            data = file.read()
     except (IOError, FileNotFoundError):
         pass
 
-    # Find the specified path elements and collect their value.
-    if path_type == 0:
-        udev_property = "disk/by-id/"
-    elif path_type == 1:
-        udev_property = "disk/by-path/"
-    elif path_type == 2:
-        udev_property = "disk/by-partuuid/"
-    elif path_type == 3:
-        udev_property = "disk/by-partlabel/"
-    elif path_type == 4:
-        udev_property = "disk/by-label/"
-    elif path_type == 5:
-        udev_property = "disk/by-uuid/"
-    for lines in file_content:
-        pos = lines.find(udev_property)
+    # Find the specified path elements and collect their value (only the matching lines will be decoded).
+    udev_property = _UDEV_PATH_TYPES[path_type]
+    for line in data.splitlines():
+        pos = line.find(udev_property)
         if pos != -1:
-            result.append("/dev/" + lines[pos:].strip())
+            result.append("/dev/" + line[pos:].decode(encoding, "replace").strip())
 
     return result
 
 
+def _parse_udev(data: bytes, encoding: str = "utf-8") -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Parses the content of an `udev` data file in a single pass. Properties (``E:`` lines) and all
+    `/dev/disk/by-*` path elements (``S:`` lines) will be collected, all other lines will be skipped. Only the
+    collected keys and values will be decoded and stripped, in case of repeated properties the first value will be
+    kept.
+
+    Args:
+        data (bytes): content of the udev data file
+        encoding (str): encoding (default is `utf-8`)
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, List[str]]]: udev properties, path elements grouped by their type (e.g.
+        `by-id`, `by-path`, `by-partuuid`, `by-partlabel`, `by-label`, `by-uuid`)
+
+    Example:
+        An example about the use of the function::
+
+            >>> from diskinfo import *
+            >>> props, links = _parse_udev(b"S:disk/by-path/pci-0000:02:00.0-nvme-1\\nE:ID_WWN=0x5002538\\n")
+            >>> props
+            {'ID_WWN': '0x5002538'}
+            >>> links
+            {'by-path': ['/dev/disk/by-path/pci-0000:02:00.0-nvme-1']}
+
+    """
+    props: Dict[str, str] = {}
+    links: Dict[str, List[str]] = {}
+
+    # Parse properties and path elements (other lines are skipped with a single prefix check).
+    for line in data.splitlines():
+        if not line.startswith(_UDEV_PREFIXES):
+            continue
+        if line.startswith(b"E:"):
+            key, _, value = line[2:].partition(b"=")
+            props.setdefault(key.decode(encoding, "replace"),
+                             value.decode(encoding, "replace").replace("\\x20", " ").strip())
+        else:
+            link_type, _, _ = line[7:].partition(b"/")
+            links.setdefault(link_type.decode(encoding, "replace"), []).append(
+                "/dev/" + line[2:].decode(encoding, "replace").strip())
+
+    return props, links
+
+
+def _load_udev(path: str, encoding: str = "utf-8") -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Loads all properties and `/dev/disk/by-*` path elements from an `udev` data file with a single read. The
+    function will hide :py:obj:`IOError` and :py:obj:`FileNotFound` exceptions during the file operations. The file
+    is read in binary mode and processed by :py:func:`~diskinfo._parse_udev`. The parsed data is cached until the
+    file is changed (i.e. its modification time, size or inode is changed by an udev event), the function returns
+    a copy of the cached data.
+
+    Args:
+        path (str): path of the udev data file (e.g. `/run/udev/data/b8:0`)
+        encoding (str): encoding (default is `utf-8`)
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, List[str]]]: udev properties, path elements grouped by their type (e.g.
+        `by-id`, `by-path`)
+
+    Raises:
+        ValueError: in case of empty input parameters
+
+    Example:
+        An example about the use of the function::
+
+            >>> from diskinfo import *
+            >>> props, links = _load_udev("/run/udev/data/b259:0")
+            >>> props["ID_MODEL"]
+            'WDS100T1X0E-00AFY0'
+            >>> links["by-path"]
+            ['/dev/disk/by-path/pci-0000:02:00.0-nvme-1']
+
+    """
+    result: Tuple[Dict[str, str], Dict[str, List[str]]] = ({}, {})
+
+    # Validate input parameters.
+    if not path:
+        raise ValueError("Invalid empty path.")
+
+    # Read and parse the udev data file only if it is not in the cache.
+    try:
+        with open(path, "rb", buffering=0) as file:
+            st = os.fstat(file.fileno())
+            key = (path, encoding, st.st_mtime_ns, st.st_size, st.st_ino)
+            cached = _UDEV_CACHE.get(key)
+            if cached is None:
+                cached = _parse_udev(file.read(), encoding)
+                if len(_UDEV_CACHE) >= _UDEV_CACHE_SIZE:
+                    _UDEV_CACHE.clear()
+                _UDEV_CACHE[key] = cached
+            result = cached
+    except (IOError, FileNotFoundError):
+        pass
+
+    return dict(result[0]), {link_type: list(paths) for link_type, paths in result[1].items()}
+
+
+def _find_byid_disks(suffix: str) -> List[str]:
+    """Returns the names of the disks having a `/dev/disk/by-id/` link whose name ends with the specified suffix
+    (partition links are skipped)."""
+    try:
+        links = os.listdir("/dev/disk/by-id/")
+    except OSError:
+        return []
+    names = []
+    for link in links:
+        _, sep, index = link.rpartition("-part")
+        if link.endswith(suffix) and not (sep and index.isdigit()):
+            names.append(os.path.basename(os.path.realpath("/dev/disk/by-id/" + link)))
+    return names
+
+
+def _iter_block_disks() -> Iterator[str]:
+    """Yields the names of the block devices in `/sys/block/` folder (the folder is read lazily, so a search can stop
+    at the first match)."""
+    with os.scandir("/sys/block/") as entries:
+        for entry in entries:
+            yield entry.name
+
+
+def _find_disk_by_udev(names: Iterable[str], key: str, match: Callable[[str], bool], encoding: str) \
+        -> Tuple[str, Union[Tuple[Dict[str, str], Dict[str, List[str]]], None]]:
+    """Finds the first disk (from the specified disk names) whose udev property `key` matches. Returns the name
+    and the loaded udev data of the disk, or an empty name and None if no disk matches."""
+    for name in names:
+        device_id = _read_file("/sys/block/" + name + "/dev", encoding)
+        udev = _load_udev("/run/udev/data/b" + device_id, encoding)
+        if match(udev[0].get(key, "")):
+            return name, udev
+    return "", None
+
+
 def size_in_hrf(size_value: int, units: int = 0) -> Tuple[float, str]:
     """Returns the size in a human-readable form.
 
@@ -185,13 +339,10 @@ def size_in_hrf(size_value: int, units: int = 0) -> Tuple[float, str]:
             11.7 TiB
 
     """
-    metric_units: List[str] = ["B", "kB", "MB", "GB", "TB", "PB", "EB"]
-    iec_units: List[str] = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB"]
-    legacy_units: List[str] = ["B", "KB", "MB", "GB", "TB", "PB", "EB"]
     divider: int        # Divider for the specified unit.
     hrf_size: float     # Result size
     hfr_unit: str       # Result unit
-    index: int = 0      # Unit index
+    index: int          # Unit index
 
     # Validate input parameters.
     if units not in (0, 1, 2):
@@ -202,26 +353,19 @@ def size_in_hrf(size_value: int, units: int = 0) -> Tuple[float, str]:
     # Set up the proper divider.
     if units == 0:
         divider = 1000
-    elif units == 1:
-        divider = 1024
     else:
         divider = 1024
 
-    # Calculate the proper size.
-    hrf_size = size_value
-    number_of_units = len(metric_units)
-    for index in range(number_of_units):
-        if hrf_size < divider:
-            break
-        hrf_size /= divider
+    # Find the proper unit index by comparing the size against the powers of the divider.
+    index = 0
+    while index < len(_SIZE_UNITS[units]) - 1 and size_value >= divider ** (index + 1):
+        index += 1
+
+    # Calculate the proper size with a single division.
+    hrf_size = size_value / divider ** index
 
     # Identify the proper unit for the calculated size.
-    if units == 0:
-        hfr_unit = metric_units[index]
-    elif units == 1:
-        hfr_unit = iec_units[index]
-    else:
-        hfr_unit = legacy_units[index]
+    hfr_unit = _SIZE_UNITS[units][index]
 
     return hrf_size, hfr_unit
 
@@ -261,10 +405,6 @@ def time_in_hrf(time: int, unit: int = 0, short_format: bool = False) -> Tuple[f
             6.6 yr
 
     """
-    time_long_units: List[str] = ["second", "minute", "hour", "day", "year"]
-    time_short_units: List[str] = ["s", "min", "h", "d", "yr"]
-    time_dividers: List[int] = [60, 60, 24, 365, 1]
-
     divider: int        # Divider for the specified unit.
     hrf_time: float     # Result size
     hfr_unit: str       # Result unit
@@ -273,25 +413,23 @@ def time_in_hrf(time: int, unit: int = 0, short_format: bool = False) -> Tuple[f
     # Validate input parameters.
     if time < 0:
         raise ValueError(f"Invalid input time value ({time}).")
-    length = len(time_long_units) - 1
+    length = len(_TIME_LONG_UNITS) - 1
     if unit < 0 or unit > length:
         raise ValueError(f"Invalid input unit ({unit}).")
 
-    # Calculate the proper time.
-    hrf_time = time
+    # Find the proper unit with integer comparisons, then calculate the time with a single division.
+    divider = 1
     index = unit
-    while index < length:
-        divider = time_dividers[index]
-        if hrf_time < divider:
-            break
-        hrf_time /= divider
+    while index < length and time >= divider * _TIME_DIVIDERS[index]:
+        divider *= _TIME_DIVIDERS[index]
         index += 1
+    hrf_time = time / divider if divider > 1 else time
 
     # Identify the proper unit for the calculated time.
     if short_format:
-        hfr_unit = time_short_units[index]
+        hfr_unit = _TIME_SHORT_UNITS[index]
     else:
-        hfr_unit = time_long_units[index]
+        hfr_unit = _TIME_LONG_UNITS[index]
 
     return hrf_time, hfr_unit
 
@@ -2,13 +2,16 @@
 #    Test data generation
 #    Peter Sulyok (C) 2022-2024.
 #
+import builtins
 import tempfile
 import random
 import shutil
 import os
 import uuid
 import time
-from typing import List
+from contextlib import ExitStack
+from typing import Callable, List
+from unittest.mock import patch, MagicMock
 from diskinfo import DiskType
 
 
@@ -67,6 +70,16 @@ class TestData:
     td_dir: str = ''        # Test data directory in /tmp
     disks: List[TestDisk]   # List of test disk data
 
+    # File system functions can be mocked by mock_fs().
+    _FS_FUNCTIONS = {
+        "os.scandir": (os, "scandir"),
+        "os.listdir": (os, "listdir"),
+        "os.open": (os, "open"),
+        "os.path.exists": (os.path, "exists"),
+        "os.path.realpath": (os.path, "realpath"),
+        "builtins.open": (builtins, "open"),
+    }
+
     def __init__(self):
         """Initialize the class. It creates a temporary directory."""
         self.td_dir = tempfile.mkdtemp()
@@ -329,6 +342,29 @@ class TestData:
             self.disks[disk_idx].partitions.append(part)
             index += 1
 
+    def mock_fs(self, *functions: str) -> ExitStack:
+        """Mocks the specified file system functions (e.g. `"os.open"`, `"builtins.open"`), absolute paths will be
+        redirected into the test data directory (paths relative to a `dir_fd` folder are not changed). The result is
+        a context manager, the original functions are restored at its exit."""
+        stack = ExitStack()
+        for name in functions:
+            module, attr = self._FS_FUNCTIONS[name]
+            stack.enter_context(patch(name, MagicMock(side_effect=self._redirect(getattr(module, attr)))))
+        return stack
+
+    def _redirect(self, function: Callable) -> Callable:
+        """Returns a mock function that calls the original `function` with a path redirected into the test data
+        directory. The function refers only to the name of the test data directory (not to this class), so the
+        class can be deleted immediately even if a mock object is still alive."""
+        td_dir = self.td_dir
+
+        def mocked_function(path, *args, **kwargs):
+            if isinstance(path, str) and path.startswith("/") and not path.startswith(td_dir) and \
+                    kwargs.get("dir_fd") is None:
+                path = td_dir + path
+            return function(path, *args, **kwargs)
+        return mocked_function
+
     @staticmethod
     def _get_random_alphanum_str(length: int) -> str:
         """Generates a random string of numbers and letters in a given length."""
@@ -2,7 +2,6 @@
 #    Unitest for `disk` module
 #    Peter Sulyok (C) 2022-2024.
 #
-import glob
 import os
 import shutil
 import random
@@ -21,51 +20,17 @@ class DiskTest(unittest.TestCase):
     def pt_init_p1(self, disk_name: str, disk_type: int, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock glob.glob(), os.readlink(), os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.realpath(), os.listdir(), os.path.exists(), builtins.open() and os.open()
+              functions
             - create Disk() class instance based on test data in all five ways
             - ASSERT: if any attribute of the class is different from the generated test data
             - delete all instance
         """
 
-        # Mock function for glob.glob().
-        def mocked_glob(file: str, *args, **kwargs):
-            if file.startswith('/sys/block'):
-                file = my_td.td_dir + file
-            return original_glob(file, *args, **kwargs)
-
-        # Mock function for os.readlink().
-        def mocked_readlink(path: str,  *args, **kwargs):
-            return original_readlink(my_td.td_dir + path, *args, **kwargs)
-
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks([disk_name], [disk_type])
-        original_glob = glob.glob
-        mock_glob = MagicMock(side_effect=mocked_glob)
-        original_readlink = os.readlink
-        mock_readlink = MagicMock(side_effect=mocked_readlink)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('glob.glob', mock_glob), \
-             patch('os.readlink', mock_readlink), \
-             patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.realpath", "os.listdir", "os.path.exists", "os.open",
+                           "builtins.open"):
 
             for i in range(5):
                 d = None
@@ -143,28 +108,15 @@ class DiskTest(unittest.TestCase):
     def pt_init_n1(self, disk_name: str, disk_type: int, error: str) -> None:
         """Primitive negative test function. It contains the following steps:
             - create TestData class
-            - mock os.readlink(), os.path.exists() and builtins.open() functions
+            - mock os.path.exists(), os.open() and builtins.open() functions
             - create Disk() class instance based on test data
             - ASSERT: if assert not raised in case of missing system files/folders
             - delete all instance
         """
 
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks([disk_name], [disk_type])
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.path.exists", "os.open", "builtins.open"):
 
             # Exception 1: missing by-path path
             if not disk_type == DiskType.LOOP:
@@ -208,28 +160,15 @@ class DiskTest(unittest.TestCase):
     def pt_init_n2(self, name: str, serial: bool, error: str) -> None:
         """Primitive negative test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.listdir(), builtins.open() and os.open() functions
             - create Disk() class instance with serial and wwn name
             - ASSERT: if assert not raised in case of invalid missing serial number or wwn name.
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(["sda"], [DiskType.SSD])
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.listdir", "os.open", "builtins.open"):
             with self.assertRaises(Exception) as cm:
                 if serial:
                     Disk(serial_number=name)
@@ -257,6 +196,14 @@ class DiskTest(unittest.TestCase):
         self.pt_init_n2("nonexisting_serial_0923409283408", True, "disk_init 9")
         self.pt_init_n2("nonexisting_wwn_0923409283408", False,  "disk_init 10")
 
+        # Test of asserts in __init__() in case of invalid by-id and by-path names.
+        with self.assertRaises(Exception) as cm:
+            Disk(byid_name="nonexisting_byid_0923409283408")
+        self.assertEqual(type(cm.exception), ValueError, "disk_init 11")
+        with self.assertRaises(Exception) as cm:
+            Disk(bypath_name="nonexisting_bypath_0923409283408")
+        self.assertEqual(type(cm.exception), ValueError, "disk_init 12")
+
     def test_get_type(self):
         """Unit test for function Disk.get_type and Disk.get_type_str."""
         d = Disk.__new__(Disk)
@@ -281,6 +228,11 @@ class DiskTest(unittest.TestCase):
         with self.assertRaises(Exception) as cm:
             d.get_type_str()
         self.assertEqual(type(cm.exception), RuntimeError, "get_type 13")
+        for invalid_type in [0, 3, -1]:
+            d._Disk__type = invalid_type
+            with self.assertRaises(Exception) as cm:
+                d.get_type_str()
+            self.assertEqual(type(cm.exception), RuntimeError, "get_type 14")
 
     def pt_gsih_p1(self, size_in_512: int, calc_size: float, calc_unit: str, metric: int, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
@@ -308,26 +260,27 @@ class DiskTest(unittest.TestCase):
         self.pt_gsih_p1(3, (3*512)/1024, "KiB", 1, "get_size_in_hrf 5")
         self.pt_gsih_p1(3, (3*512)/1024, "KB", 2, "get_size_in_hrf 6")
 
-        self.pt_gsih_p1(6144, (6144*512)/1000/1000, "MB", 0, "get_size_in_hrf 7")
-        self.pt_gsih_p1(6144, (6144*512)/1024/1024, "MiB", 1, "get_size_in_hrf 8")
-        self.pt_gsih_p1(6144, (6144*512)/1024/1024, "MB", 2, "get_size_in_hrf 9")
+        self.pt_gsih_p1(6144, (6144*512)/1000**2, "MB", 0, "get_size_in_hrf 7")
+        self.pt_gsih_p1(6144, (6144*512)/1024**2, "MiB", 1, "get_size_in_hrf 8")
+        self.pt_gsih_p1(6144, (6144*512)/1024**2, "MB", 2, "get_size_in_hrf 9")
 
-        self.pt_gsih_p1(16777216, (16777216*512)/1000/1000/1000, "GB", 0, "get_size_in_hrf 10")
-        self.pt_gsih_p1(16777216, (16777216*512)/1024/1024/1024, "GiB", 1, "get_size_in_hrf 11")
-        self.pt_gsih_p1(16777216, (16777216*512)/1024/1024/1024, "GB", 2, "get_size_in_hrf 12")
+        self.pt_gsih_p1(16777216, (16777216*512)/1000**3, "GB", 0, "get_size_in_hrf 10")
+        self.pt_gsih_p1(16777216, (16777216*512)/1024**3, "GiB", 1, "get_size_in_hrf 11")
+        self.pt_gsih_p1(16777216, (16777216*512)/1024**3, "GB", 2, "get_size_in_hrf 12")
 
-        self.pt_gsih_p1(8589934592, (8589934592*512)/1000/1000/1000/1000, "TB", 0, "get_size_in_hrf 13")
-        self.pt_gsih_p1(8589934592, (8589934592*512)/1024/1024/1024/1024, "TiB", 1, "get_size_in_hrf 14")
-        self.pt_gsih_p1(8589934592, (8589934592*512)/1024/1024/1024/1024, "TB", 2, "get_size_in_hrf 15")
+        self.pt_gsih_p1(8589934592, (8589934592*512)/1000**4, "TB", 0, "get_size_in_hrf 13")
+        self.pt_gsih_p1(8589934592, (8589934592*512)/1024**4, "TiB", 1, "get_size_in_hrf 14")
+        self.pt_gsih_p1(8589934592, (8589934592*512)/1024**4, "TB", 2, "get_size_in_hrf 15")
 
-        self.pt_gsih_p1(4398046511104, (4398046511104*512)/1000/1000/1000/1000/1000, "PB", 0, "get_size_in_hrf 16")
-        self.pt_gsih_p1(4398046511104, (4398046511104*512)/1024/1024/1024/1024/1024, "PiB", 1, "get_size_in_hrf 17")
-        self.pt_gsih_p1(4398046511104, (4398046511104*512)/1024/1024/1024/1024/1024, "PB", 2, "get_size_in_hrf 18")
+        self.pt_gsih_p1(4398046511104, (4398046511104*512)/1000**5, "PB", 0, "get_size_in_hrf 16")
+        self.pt_gsih_p1(4398046511104, (4398046511104*512)/1024**5, "PiB", 1, "get_size_in_hrf 17")
+        self.pt_gsih_p1(4398046511104, (4398046511104*512)/1024**5, "PB", 2, "get_size_in_hrf 18")
 
     def pt_gt_p1(self, disk_name: str, disk_type: int, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock glob.glob(), os.path.exists(), builtins.open(), Device.__init__(), Device.temperature() functions
+            - mock os.scandir(), os.path.exists(), builtins.open(), os.open(), Device.__init__(), Device.temperature()
+              functions
             - create Disk() class instance
             - call get_temperature() method
             - ASSERT: if the returned temperature is different from the generated test data
@@ -335,38 +288,12 @@ class DiskTest(unittest.TestCase):
         """
         temp_val: float = 0.0
 
-        # Mock function for glob.glob().
-        def mocked_glob(file: str, *args, **kwargs):
-            if file.startswith('/sys/block'):
-                file = my_td.td_dir + file
-            return original_glob(file, *args, **kwargs)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            if not path.startswith(my_td.td_dir):
-                path = my_td.td_dir + path
-            return original_exists(path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str, *args, **kwargs):
-            if not path.startswith(my_td.td_dir):
-                path = my_td.td_dir + path
-            return original_open(path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks([disk_name], [disk_type])
         if disk_type != DiskType.LOOP:
             temp_str = _read_file(my_td.disks[0].hwmon_path)
             temp_val = float(temp_str) / 1000
-        original_glob = glob.glob
-        mock_glob = MagicMock(side_effect=mocked_glob)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('glob.glob', mock_glob), \
-                patch('os.path.exists', mock_exists), \
-                patch('builtins.open', mock_open), \
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"), \
                 patch.object(Device, '__init__', return_value=None), \
                 patch('pySMART.Device.temperature', new_callable=PropertyMock) as mock_device_temp:
             if disk_type == DiskType.LOOP:
@@ -386,42 +313,16 @@ class DiskTest(unittest.TestCase):
     def pt_gt_n1(self, disk_name: str, disk_type: int, error: str) -> None:
         """Primitive negative test function. It contains the following steps:
             - create TestData class
-            - mock glob.glob(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create Disk() class instance
             - call get_temperature() method
             - ASSERT: if the return value is not None
             - delete all instance
         """
 
-        # Mock function for glob.glob().
-        def mocked_glob(file: str, *args, **kwargs):
-            if file.startswith('/sys/block'):
-                file = my_td.td_dir + file
-            return original_glob(file, *args, **kwargs)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            if not path.startswith(my_td.td_dir):
-                path = my_td.td_dir + path
-            return original_exists(path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str, *args, **kwargs):
-            if not path.startswith(my_td.td_dir):
-                path = my_td.td_dir + path
-            return original_open(path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks([disk_name], [disk_type])
-        original_glob = glob.glob
-        mock_glob = MagicMock(side_effect=mocked_glob)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('glob.glob', mock_glob), \
-                patch('os.path.exists', mock_exists), \
-                patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             d = Disk(disk_name)
             if disk_type != DiskType.LOOP:
                 os.system("echo 'something' > " + my_td.disks[0].hwmon_path)
@@ -454,13 +355,13 @@ class DiskTest(unittest.TestCase):
 
     def pt_gsd_p1(self, disk: Disk, nocheck: bool, sudo: bool, smartctrl_path: str, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
-            - mock pySMART.SMARTCTL.generic_call() function
+            - mock pySMART.smartctl.Smartctl.generic_call() function
             - call get_smart_data() method for a given Disk class
             - ASSERT: if SMART attributes are different from test data
         """
         tsd: TestSmartData
 
-        # Mock function for pySMART.SMARTCLT.generic_call()
+        # Mock function for pySMART.smartctl.Smartctl.generic_call()
         # pylint: disable=R0911,W0613
         def mocked_smartctl_generic_call(params: List[str], pass_options: bool = False) -> Tuple[List[str], int]:
             if "--info" in params:
@@ -479,7 +380,7 @@ class DiskTest(unittest.TestCase):
 
         tsd = TestSmartData()
         mock_smartctl_generic_call = MagicMock(side_effect=mocked_smartctl_generic_call)
-        with patch('pySMART.SMARTCTL.generic_call', mock_smartctl_generic_call):
+        with patch('pySMART.smartctl.Smartctl.generic_call', mock_smartctl_generic_call):
             sd = disk.get_smart_data(nocheck=nocheck, sudo=sudo, smartctl_path=smartctrl_path)
             self.assertTrue(sd, error)
             if disk.is_nvme():
@@ -539,13 +440,13 @@ class DiskTest(unittest.TestCase):
 
     def pt_gsd_p2(self, disk: Disk, nocheck: bool, sudo: bool, smartctrl_path: str, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
-            - mock pySMART.SMARTCTL.generic_call() function
+            - mock pySMART.smartctl.Smartctl.generic_call() function
             - call get_smart_data() method for a given Disk class
             - ASSERT: if assessment is not FAIL
         """
         tsd: TestSmartData
 
-        # Mock function for pySMART.SMARTCLT.generic_call()
+        # Mock function for pySMART.smartctl.Smartctl.generic_call()
         # pylint: disable=R0911,W0613
         def mocked_smartctl_generic_call(params: List[str], pass_options: bool = False) -> Tuple[List[str], int]:
             if "--info" in params:
@@ -556,7 +457,7 @@ class DiskTest(unittest.TestCase):
 
         tsd = TestSmartData()
         mock_smartctl_generic_call = MagicMock(side_effect=mocked_smartctl_generic_call)
-        with patch('pySMART.SMARTCTL.generic_call', mock_smartctl_generic_call):
+        with patch('pySMART.smartctl.Smartctl.generic_call', mock_smartctl_generic_call):
             sd = disk.get_smart_data(nocheck=nocheck, sudo=sudo, smartctl_path=smartctrl_path)
             self.assertEqual(False, sd.healthy, error)
         del sd
@@ -564,20 +465,20 @@ class DiskTest(unittest.TestCase):
 
     def pt_gsd_p3(self, disk: Disk, nocheck: bool, sudo: bool, smartctrl_path: str, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
-            - mock pySMART.SMARTCTL.generic_call() function
+            - mock pySMART.smartctl.Smartctl.generic_call() function
             - call get_smart_data() method for a given Disk class
             - ASSERT: if disk is not in STANDBY mode
         """
         tsd: TestSmartData
 
-        # Mock function for pySMART.SMARTCLT.generic_call()
+        # Mock function for pySMART.smartctl.Smartctl.generic_call()
         # pylint: disable=R0911,W0613
         def mocked_smartctl_generic_call(params: List[str], pass_options: bool = False) -> Tuple[List[str], int]:
             return tsd.tsd[3].input_info, 2
 
         tsd = TestSmartData()
         mock_smartctl_generic_call = MagicMock(side_effect=mocked_smartctl_generic_call)
-        with patch('pySMART.SMARTCTL.generic_call', mock_smartctl_generic_call):
+        with patch('pySMART.smartctl.Smartctl.generic_call', mock_smartctl_generic_call):
             sd = disk.get_smart_data(nocheck=nocheck, sudo=sudo, smartctl_path=smartctrl_path)
             self.assertEqual(True, sd.standby_mode, error)
         del sd
@@ -585,31 +486,31 @@ class DiskTest(unittest.TestCase):
 
     def pt_gsd_n1(self, disk: Disk, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
-            - mock pySMART.SMARTCTL.generic_call() function
+            - mock pySMART.smartctl.Smartctl.generic_call() function
             - call get_smart_data() with empty output from `smartctl`
             - ASSERT: if not None return value will be provided
         """
 
-        # Mock function for pySMART.SMARTCLT.generic_call()
+        # Mock function for pySMART.smartctl.Smartctl.generic_call()
         # pylint: disable=R0911,W0613
         def mocked_smartctl_generic_call(params: List[str], pass_options: bool = False) -> Tuple[List[str], int]:
             return [], 1
 
         mock_smartctl_generic_call = MagicMock(side_effect=mocked_smartctl_generic_call)
-        with patch('pySMART.SMARTCTL.generic_call', mock_smartctl_generic_call):
+        with patch('pySMART.smartctl.Smartctl.generic_call', mock_smartctl_generic_call):
             sd = disk.get_smart_data()
             self.assertEqual(None, sd, error)
             del sd
 
     def pt_gsd_n2(self, disk: Disk, tc: int, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
-            - mock pySMART.SMARTCTL.generic_call() function
+            - mock pySMART.smartctl.Smartctl.generic_call() function
             - call get_smart_data() for a loop disk
             - ASSERT: if not None return value will be provided
         """
         tsd: TestSmartData
 
-        # Mock function for pySMART.SMARTCLT.generic_call()
+        # Mock function for pySMART.smartctl.Smartctl.generic_call()
         # pylint: disable=R0911,W0613
         def mocked_smartctl_generic_call(params: List[str], pass_options: bool = False) -> Tuple[List[str], int]:
             if "--info" in params:
@@ -618,7 +519,7 @@ class DiskTest(unittest.TestCase):
 
         tsd = TestSmartData()
         mock_smartctl_generic_call = MagicMock(side_effect=mocked_smartctl_generic_call)
-        with patch('pySMART.SMARTCTL.generic_call', mock_smartctl_generic_call):
+        with patch('pySMART.smartctl.Smartctl.generic_call', mock_smartctl_generic_call):
             sd = disk.get_smart_data()
             self.assertEqual(None, sd, error)
             del sd
@@ -665,48 +566,48 @@ class DiskTest(unittest.TestCase):
     def pt_gpl_p1(self, disk_name: str, disk_type: int, part_num: int, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock glob.glob(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create Disk() class instance
             - create partitions for Disk() class
             - call get_partition_list() method
             - ASSERT: if number of identified partitions are different from the expected number
             - delete all instances
         """
-        def mocked_glob(file: str, *args, **kwargs):
-            if file.startswith('/sys/block'):
-                file = my_td.td_dir + file
-            return original_glob(file, *args, **kwargs)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            if not path.startswith(my_td.td_dir):
-                path = my_td.td_dir + path
-            return original_exists(path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            if not path.startswith(my_td.td_dir):
-                path = my_td.td_dir + path
-            return original_open(path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks([disk_name], [disk_type])
         my_td.create_partitions(0, part_num)
-        original_glob = glob.glob
-        mock_glob = MagicMock(side_effect=mocked_glob)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('glob.glob', mock_glob), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             d = Disk(disk_name)
             plist = d.get_partition_list()
             self.assertEqual(len(plist), part_num, error)
+            self.assertEqual([p.get_name() for p in plist], [p.name for p in my_td.disks[0].partitions], error)
             del d
         del my_td
 
+    def test_get_smart_data_bulk(self):
+        """Unit test for get_smart_data_bulk() method of Disk class."""
+
+        # Mock function for Disk.get_smart_data().
+        def mocked_get_smart_data(d: Disk, **kwargs):
+            calls.append((d.get_name(), kwargs))
+            return d.get_name() + "-smart"
+
+        calls = []
+        disks = []
+        for name in ["sda", "sdb", "sdc", "nvme0n1"]:
+            d = Disk.__new__(Disk)
+            d._Disk__name = name
+            disks.append(d)
+        with patch.object(Disk, 'get_smart_data', autospec=True, side_effect=mocked_get_smart_data):
+            result = Disk.get_smart_data_bulk(disks, nocheck=True, sudo=True, max_workers=2)
+        self.assertEqual(result, ["sda-smart", "sdb-smart", "sdc-smart", "nvme0n1-smart"], "get_smart_data_bulk 1")
+        self.assertEqual(sorted(name for name, _ in calls), ["nvme0n1", "sda", "sdb", "sdc"], "get_smart_data_bulk 2")
+        for _, kwargs in calls:
+            self.assertEqual(kwargs, {"nocheck": True, "sudo": True, "smartctl_path": "/usr/sbin/smartctl"},
+                             "get_smart_data_bulk 3")
+        self.assertEqual(Disk.get_smart_data_bulk([]), [], "get_smart_data_bulk 4")
+        del disks
+
     def test_get_partition_list(self):
         """Unit test for get_partition_list() method of Disk class."""
 
@@ -715,6 +616,7 @@ class DiskTest(unittest.TestCase):
         self.pt_gpl_p1("sda", DiskType.HDD, 2, "get_partition_list 2")
         self.pt_gpl_p1("sda", DiskType.SSD, 3, "get_partition_list 3")
         self.pt_gpl_p1("nvme0n1", DiskType.NVME, 6, "get_partition_list 4")
+        self.pt_gpl_p1("sdb", DiskType.SSD, 12, "get_partition_list 5")
 
     def test_operators(self):
         """Unit test for operators implemented in Disk class"""
@@ -730,6 +632,12 @@ class DiskTest(unittest.TestCase):
         self.assertTrue(d3 > d1)
         self.assertFalse(d1 > d3)
         self.assertFalse(d3 < d1)
+        self.assertEqual(hash(d1), hash(d2))
+        self.assertEqual(len({d1, d2, d3}), 2)
+        self.assertFalse(d1 == "sda")
+        self.assertTrue(d1 != None)     # pylint: disable=singleton-comparison
+        with self.assertRaises(TypeError):
+            _ = d1 < "sdb"
         del d3
         del d2
         del d1
@@ -737,22 +645,9 @@ class DiskTest(unittest.TestCase):
     def test_repr(self):
         """Unit test for __repr__ in Disk class"""
 
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(["sda"], [DiskType.HDD])
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.path.exists", "os.open", "builtins.open"):
             d = Disk("sda")
             result = repr(d)
             self.assertTrue(d.get_name() in result, "repr 1")
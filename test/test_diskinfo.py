@@ -2,12 +2,11 @@
 #    Unitest for `diskinfo` module
 #    Peter Sulyok (C) 2022-2024.
 #
-import os
 import unittest
 from typing import List
-from unittest.mock import patch, MagicMock
 from test_data import TestData
 from diskinfo import DiskType, Disk, DiskInfo
+from diskinfo.diskinfo import _ENUM_CACHE
 
 
 class DiskInfoTest(unittest.TestCase):
@@ -64,37 +63,52 @@ class DiskInfoTest(unittest.TestCase):
     def pt_init_p1(self, disk_names: List[str], disk_types: List[int], error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance
             - ASSERT: if proper amount disks are discovered
+            - ASSERT: if DiskInfo() class instances created with `cache=True` reuse copies of the cached disks
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
+        my_td = TestData()
+        my_td.create_disks(disk_names, disk_types)
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
+            di = DiskInfo()
+            self.assertEqual(di.get_disk_number(), len(disk_names), error)
+            # The first cached instance explores the disks, the second one is created from the cache.
+            _ENUM_CACHE["names"] = None
+            di2 = DiskInfo(cache=True)
+            di3 = DiskInfo(cache=True)
+            self.assertEqual(di3.get_disk_list(), di.get_disk_list(), error)
+            for disk2, disk3 in zip(di2.get_disk_list(), di3.get_disk_list()):
+                self.assertIsNot(disk2, disk3, error)
+                self.assertEqual(repr(disk2), repr(disk3), error)
+                self.assertIsNot(disk2.get_byid_path(), disk3.get_byid_path(), error)
+            del di3
+            del di2
+            del di
+        del my_td
 
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
+    def pt_init_p2(self, disk_names: List[str], disk_types: List[int], error: str) -> None:
+        """Primitive positive test function. It contains the following steps:
+            - create TestData class
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
+            - set the size of the loop devices to zero
+            - create DiskInfo() class instance
+            - ASSERT: if empty loop devices are not skipped
+            - delete all instance
+        """
 
         my_td = TestData()
         my_td.create_disks(disk_names, disk_types)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        for disk in my_td.disks:
+            if disk.type == DiskType.LOOP:
+                TestData._create_file(my_td.td_dir + "/sys/block/" + disk.name + "/size", "0")
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
-            self.assertEqual(di.get_disk_number(), len(disk_names), error)
+            self.assertEqual(di.get_disk_number(), disk_types.count(DiskType.HDD) + disk_types.count(DiskType.SSD) +
+                             disk_types.count(DiskType.NVME), error)
+            self.assertEqual(di.get_disk_number(included={DiskType.LOOP}), 0, error)
             del di
         del my_td
 
@@ -105,38 +119,23 @@ class DiskInfoTest(unittest.TestCase):
         for i, tdl in enumerate(self.test_disks_list):
             self.pt_init_p1(tdl[0], tdl[1], "diskinfo_init " + str(i + 1))
 
+        # Test that empty loop devices are skipped.
+        self.pt_init_p2(["sda", "loop0", "nvme0n1", "loop1"],
+                        [DiskType.SSD, DiskType.LOOP, DiskType.NVME, DiskType.LOOP],
+                        "diskinfo_init " + str(len(self.test_disks_list) + 1))
+
     def pt_gdn_p1(self, disk_names: List[str], disk_types: List[int], error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance and call get_disk_number() function
             - ASSERT: if the filtered result is different that  calculated
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(disk_names, disk_types)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             count_nvme = disk_types.count(DiskType.NVME)
             count_ssd = disk_types.count(DiskType.SSD)
@@ -172,35 +171,15 @@ class DiskInfoTest(unittest.TestCase):
     def pt_gdn_n1(self, disk_names: List[str], disk_types: List[int], incl: set, excl: set, error: str) -> None:
         """Primitive negative test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance and call get_disk_number()
             - ASSERT: if no assertion will be raised in case of invalid included and excluded lists
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(disk_names, disk_types)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             with self.assertRaises(Exception) as cm:
                 di.get_disk_number(included=incl, excluded=excl)
@@ -222,35 +201,15 @@ class DiskInfoTest(unittest.TestCase):
     def pt_gdl_p1(self, disk_names: List[str], disk_types: List[int], error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance and call det_disk_list() function
             - ASSERT: if length of the filtered result list is different from calculated size
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(disk_names, disk_types)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             count_nvme = disk_types.count(DiskType.NVME)
             count_ssd = disk_types.count(DiskType.SSD)
@@ -284,35 +243,15 @@ class DiskInfoTest(unittest.TestCase):
     def pt_gdl_p2(self, disk_names: List[str], expected_name: List[str], so: bool, ro: bool, error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance and call get_disk_list()
             - ASSERT: if sorted result list will be different from the expected list.
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(disk_names, [DiskType.SSD] * len(disk_names))
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             sorted_list = di.get_disk_list(sorting=so, rev_order=ro)
             for index, disk in enumerate(sorted_list):
@@ -323,35 +262,15 @@ class DiskInfoTest(unittest.TestCase):
     def pt_gdl_n1(self, disk_names: List[str], disk_types: List[int], incl: set, excl: set, error: str) -> None:
         """Primitive negative test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance and call get_disk_list()
             - ASSERT: if no assertion will be raised in case of invalid filters (included and excluded lists)
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(disk_names, disk_types)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             with self.assertRaises(Exception) as cm:
                 di.get_disk_list(included=incl, excluded=excl)
@@ -383,35 +302,15 @@ class DiskInfoTest(unittest.TestCase):
     def pt_con_p1(self, disk_names: List[str], disk_types: List[int], error: str) -> None:
         """Primitive positive test function. It contains the following steps:
             - create TestData class
-            - mock os.listdir(), os.path.exists() and builtins.open() functions
+            - mock os.scandir(), os.path.exists(), builtins.open() and os.open() functions
             - create DiskInfo() class instance and call __contains__()
             - ASSERT: if a disk is not found in the identified list of disks
             - delete all instance
         """
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(disk_names, disk_types)
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             for name in disk_names:
                 disk = Disk(name)
@@ -432,29 +331,9 @@ class DiskInfoTest(unittest.TestCase):
     def test_rep(self):
         """Unit test for __repr__ function of DiskInfo class."""
 
-        # Mock function for os.listdir().
-        def mocked_listdir(path: str):
-            return original_listdir(my_td.td_dir + path)
-
-        # Mock function for os.path.exists().
-        def mocked_exists(path: str):
-            return original_exists(my_td.td_dir + path)
-
-        # Mock function for builtin.open().
-        def mocked_open(path: str,  *args, **kwargs):
-            return original_open(my_td.td_dir + path, *args, **kwargs)
-
         my_td = TestData()
         my_td.create_disks(["sda", "sdb"], [DiskType.SSD, DiskType.HDD])
-        original_listdir = os.listdir
-        mock_listdir = MagicMock(side_effect=mocked_listdir)
-        original_exists = os.path.exists
-        mock_exists = MagicMock(side_effect=mocked_exists)
-        original_open = open
-        mock_open = MagicMock(side_effect=mocked_open)
-        with patch('os.listdir', mock_listdir), \
-             patch('os.path.exists', mock_exists), \
-             patch('builtins.open', mock_open):
+        with my_td.mock_fs("os.scandir", "os.path.exists", "os.open", "builtins.open"):
             di = DiskInfo()
             self.assertEqual(di.get_disk_number(), 2, "diskinfo repr 1")
             disk_list = di.get_disk_list()
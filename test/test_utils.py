@@ -2,9 +2,12 @@
 #    Unitest for `utils` module
 #    Peter Sulyok (C) 2022-2024.
 #
+import os
 import unittest
 from test_data import TestData
-from diskinfo import DiskType, _read_file, _read_udev_property, _read_udev_path, size_in_hrf, time_in_hrf
+from diskinfo import DiskType, _read_file, _read_udev_property, _read_udev_path, _parse_udev, _load_udev, \
+    size_in_hrf, time_in_hrf
+from diskinfo.utils import _find_byid_disks, _iter_block_disks, _find_disk_by_udev
 
 
 class UtilsTest(unittest.TestCase):
@@ -19,6 +22,13 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(_read_file(path), content, "test_read_file 1")
         self.assertEqual(_read_file("./nonexistent_dir/nonexistent_dir/nonexistent_file"), "", "test_read_file 2")
         self.assertEqual(_read_file(""), "", "test_read_file 3")
+        fd = os.open(my_td.td_dir, os.O_RDONLY | os.O_DIRECTORY)
+        self.assertEqual(_read_file(os.path.basename(path), dir_fd=fd), content, "test_read_file 4")
+        self.assertEqual(_read_file("nonexistent_file", dir_fd=fd), "", "test_read_file 5")
+        os.close(fd)
+        content = "0123456789abcdef" * 600
+        TestData._create_file(path, content)
+        self.assertEqual(_read_file(path), content, "test_read_file 6")
         del my_td
 
     def test_read_udev_property(self):
@@ -71,6 +81,131 @@ class UtilsTest(unittest.TestCase):
 
         del my_td
 
+    def test_parse_udev(self):
+        """Unit test for _parse_udev() function."""
+        data = b"S:disk/by-id/ata-Samsung_SSD_850_PRO_1TB_92837A469FF876\n" \
+               b"S:disk/by-path/pci-0000:00:17.0-ata-3\n" \
+               b"S:disk/by-uuid/1234-ABCD\n" \
+               b"I:1234567\n" \
+               b"E:ID_MODEL_ENC=Samsung\\x20SSD\\x20850\\x20PRO\\x201TB\\x20\\x20\n" \
+               b"E:ID_SERIAL_SHORT=92837A469FF876\n" \
+               b"E:ID_SERIAL_SHORT=ANOTHER_VALUE\n" \
+               b"G:systemd\n"
+
+        # Test valid values.
+        props, links = _parse_udev(data)
+        self.assertEqual(props, {"ID_MODEL_ENC": "Samsung SSD 850 PRO 1TB", "ID_SERIAL_SHORT": "92837A469FF876"},
+                         "test_parse_udev 1")
+        self.assertEqual(links["by-id"], ["/dev/disk/by-id/ata-Samsung_SSD_850_PRO_1TB_92837A469FF876"],
+                         "test_parse_udev 2")
+        self.assertEqual(links["by-path"], ["/dev/disk/by-path/pci-0000:00:17.0-ata-3"], "test_parse_udev 3")
+        self.assertEqual(_parse_udev(b""), ({}, {}), "test_parse_udev 4")
+        self.assertEqual(links["by-uuid"], ["/dev/disk/by-uuid/1234-ABCD"], "test_parse_udev 5")
+
+    def test_load_udev(self):
+        """Unit test for _load_udev() function."""
+        my_td = TestData()
+        my_td.create_disks(["sda"], [DiskType.SSD])
+        path = my_td.td_dir + "/run/udev/data/b" + my_td.disks[0].dev_id
+
+        # Test valid values.
+        props, links = _load_udev(path)
+        self.assertEqual(props["ID_WWN"], my_td.disks[0].wwn, "test_load_udev 1")
+        self.assertEqual(props["ID_SERIAL_SHORT"], my_td.disks[0].serial, "test_load_udev 2")
+        self.assertEqual(props["ID_MODEL_ENC"], my_td.disks[0].model, "test_load_udev 3")
+        self.assertEqual(links["by-id"], [p.replace(my_td.td_dir, "") for p in my_td.disks[0].byid_path],
+                         "test_load_udev 4")
+        self.assertEqual(links["by-path"], [p.replace(my_td.td_dir, "") for p in my_td.disks[0].bypath_path],
+                         "test_load_udev 5")
+        self.assertEqual(_load_udev("./NON-EXISTING_FILE#"), ({}, {}), "test_load_udev 6")
+
+        # Test the cache: returned data can be modified, and a changed file is parsed again.
+        props["ID_WWN"] = "modified"
+        links["by-id"].clear()
+        props, links = _load_udev(path)
+        self.assertEqual(props["ID_WWN"], my_td.disks[0].wwn, "test_load_udev 7")
+        self.assertEqual(links["by-id"], [p.replace(my_td.td_dir, "") for p in my_td.disks[0].byid_path],
+                         "test_load_udev 8")
+        with open(path, "at", encoding="utf-8") as file:
+            file.write("E:ID_NEW_PROPERTY=new value\n")
+        props, _ = _load_udev(path)
+        self.assertEqual(props["ID_NEW_PROPERTY"], "new value", "test_load_udev 9")
+
+        # Test exceptions.
+        with self.assertRaises(Exception) as cm:
+            # Empty path.
+            _load_udev("")
+        self.assertEqual(type(cm.exception), ValueError, "test_load_udev assert-1")
+
+        del my_td
+
+    def test_find_byid_disks(self):
+        """Unit test for _find_byid_disks() function."""
+        my_td = TestData()
+        my_td.create_disks(["sda", "sdb", "nvme0n1"], [DiskType.SSD, DiskType.HDD, DiskType.NVME])
+        serial = my_td.disks[1].serial
+        os.symlink("../../sdb1", my_td.disks[1].byid_path[0] + "-part1")
+        with my_td.mock_fs("os.listdir", "os.path.realpath"):
+
+            # Test valid values.
+            self.assertEqual(_find_byid_disks("_" + serial), ["sdb"], "test_find_byid_disks 1")
+            self.assertEqual(_find_byid_disks("-" + my_td.disks[2].wwn), ["nvme0n1"], "test_find_byid_disks 2")
+
+            # Test partition links (they are skipped even if their name ends with the suffix).
+            self.assertEqual(_find_byid_disks("_" + serial + "-part1"), [], "test_find_byid_disks 3")
+
+            # Test no match.
+            self.assertEqual(_find_byid_disks("_NONEXISTENT"), [], "test_find_byid_disks 4")
+        del my_td
+
+        # Test missing `/dev/disk/by-id/` folder.
+        my_td = TestData()
+        with my_td.mock_fs("os.listdir", "os.path.realpath"):
+            self.assertEqual(_find_byid_disks("_NONEXISTENT"), [], "test_find_byid_disks 5")
+        del my_td
+
+    def test_iter_block_disks(self):
+        """Unit test for _iter_block_disks() function."""
+        my_td = TestData()
+        my_td.create_disks(["sda", "sdb", "nvme0n1", "loop0"],
+                           [DiskType.SSD, DiskType.HDD, DiskType.NVME, DiskType.LOOP])
+        with my_td.mock_fs("os.scandir"):
+            self.assertEqual(sorted(_iter_block_disks()), ["loop0", "nvme0n1", "sda", "sdb"], "test_iter_block_disks 1")
+        del my_td
+
+    def test_find_disk_by_udev(self):
+        """Unit test for _find_disk_by_udev() function."""
+        my_td = TestData()
+        my_td.create_disks(["sda", "sdb", "nvme0n1"], [DiskType.SSD, DiskType.HDD, DiskType.NVME])
+        serial = my_td.disks[1].serial
+        with my_td.mock_fs("os.scandir", "os.listdir", "os.path.realpath", "os.open", "builtins.open"):
+
+            # Test valid values.
+            name, udev = _find_disk_by_udev(["sda", "sdb", "nvme0n1"], "ID_SERIAL_SHORT",
+                                            lambda value: value == serial, "utf-8")
+            self.assertEqual(name, "sdb", "test_find_disk_by_udev 1")
+            self.assertEqual(udev[0]["ID_WWN"], my_td.disks[1].wwn, "test_find_disk_by_udev 2")
+            self.assertEqual(udev[1]["by-id"], [p.replace(my_td.td_dir, "") for p in my_td.disks[1].byid_path],
+                             "test_find_disk_by_udev 3")
+
+            # Test no match.
+            self.assertEqual(_find_disk_by_udev(["sda", "sdb", "nvme0n1"], "ID_SERIAL_SHORT",
+                                                lambda value: value == "NONEXISTENT", "utf-8"), ("", None),
+                             "test_find_disk_by_udev 4")
+            self.assertEqual(_find_disk_by_udev(_iter_block_disks(), "ID_SERIAL_SHORT",
+                                                lambda value: value == "NONEXISTENT", "utf-8"), ("", None),
+                             "test_find_disk_by_udev 5")
+
+            # Test a disk whose by-id link does not contain its serial number: only the scan of all disks finds it.
+            os.rename(my_td.disks[1].byid_path[0], my_td.td_dir + "/dev/disk/by-id/ata-RENAMED_LINK")
+            self.assertEqual(_find_disk_by_udev(_find_byid_disks("_" + serial), "ID_SERIAL_SHORT",
+                                                lambda value: value == serial, "utf-8"), ("", None),
+                             "test_find_disk_by_udev 6")
+            name, _ = _find_disk_by_udev(_iter_block_disks(), "ID_SERIAL_SHORT", lambda value: value == serial,
+                                         "utf-8")
+            self.assertEqual(name, "sdb", "test_find_disk_by_udev 7")
+        del my_td
+
     def test_size_in_hrf(self):
         """Unit test for size_in_hrf() function."""
 